@@ -1,78 +1,360 @@
 #!/usr/bin/env python3
 """
 Example batch processing script for multiple clothing items
+
+Items are read from a JSON file (default: items.json), either a list of
+item objects or an object with an "items" list, in the same format as
+json_scraper.py.
 """
 
 import sys
 import os
+import csv
+import json
 import time
+import shelve
+import hashlib
+import logging
+import argparse
+import threading
+from dataclasses import dataclass, asdict
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Optional fast JSON parser for large item files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional progress bar
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
 
 # Add current directory to path to import ClothingImageScraper
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from clothing_image_scraper import ClothingImageScraper
+    from clothing_image_scraper import ClothingImageScraper, build_session, build_image_client
 except ImportError:
     print("ERROR: clothing_image_scraper.py not found in the same directory!")
     print("Please make sure clothing_image_scraper.py is in the same folder as this script.")
     sys.exit(1)
 
-# Define your items to scrape
-items_to_scrape = [
-    {
-        "brand": "stuart weitzman",
-        "model": "SD166",
-        "style": "GEMCUT 85 SANDAL",
-        "max_images": 5
-    },
-    {
-        "brand": "Nike",
-        "model": "Air Max 270",
-        "style": "Running Shoe",
-        "color": "Black",
-        "max_images": 3
-    },
-    {
-        "brand": "Adidas",
-        "style": "Ultraboost",
-        "color": "White",
-        "max_images": 4
-    },
-    # Add more items as needed
-]
-
-def batch_scrape():
-    """Process all items in the batch"""
-    scraper = ClothingImageScraper(download_path="./batch_downloads")
-    
-    total_downloaded = 0
-    
-    for idx, item in enumerate(items_to_scrape, 1):
-        print(f"\n{'='*60}")
-        print(f"Processing item {idx}/{len(items_to_scrape)}")
-        print(f"{'='*60}")
+# Maximum number of items searched at the same time
+MAX_CONCURRENT_ITEMS = 4
+# Maximum number of items downloading images at the same time
+MAX_CONCURRENT_DOWNLOADS = 4
+
+DEFAULT_ITEMS_FILE = "items.json"
+# Informational item keys that are not search parameters
+IGNORED_ITEM_KEYS = ('notes',)
+
+DOWNLOAD_DIR = "./batch_downloads"
+# Results cache: item key -> {'ts': time scraped, 'files': downloaded paths}
+CACHE_FILE = os.path.join(DOWNLOAD_DIR, ".cache")
+DEFAULT_MAX_AGE = 86400  # Seconds a cached result stays valid
+DEFAULT_RATE_PER_MIN = 30  # Item scrapes started per minute
+LOG_FILE = os.path.join(DOWNLOAD_DIR, "batch.log")
+
+log = logging.getLogger("batch")
+
+
+class _TqdmHandler(logging.StreamHandler):
+    """Console handler that prints above the progress bar instead of through it"""
+    
+    def emit(self, record):
+        try:
+            tqdm.write(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def _setup_logging():
+    """Send batch messages to the console and to LOG_FILE"""
+    if log.handlers:
+        return
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    log.setLevel(logging.INFO)
+    console = _TqdmHandler() if TQDM_AVAILABLE else logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(console)
+    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    log.addHandler(file_handler)
+
+
+@dataclass(frozen=True)
+class ScrapeItem:
+    """One validated entry of the items file"""
+    brand: Optional[str] = None
+    barcode: Optional[str] = None
+    model: Optional[str] = None
+    style: Optional[str] = None
+    color: Optional[str] = None
+    url: Optional[str] = None
+    max_images: int = 5
+    
+    def __post_init__(self):
+        search_fields = ('brand', 'barcode', 'model', 'style', 'color', 'url')
+        for field in search_fields:
+            value = getattr(self, field)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"{field} must be a string")
+        if not any(getattr(self, field) for field in search_fields):
+            raise ValueError(f"needs at least one of: {', '.join(search_fields)}")
+        if not isinstance(self.max_images, int) or self.max_images < 1:
+            raise ValueError("max_images must be a positive integer")
+    
+    def search_kwargs(self):
+        """Keyword arguments for scrape_and_download, excluding max_images"""
+        kwargs = {k: v for k, v in asdict(self).items()
+                  if k not in ('max_images', 'url') and v is not None}
+        if self.url:
+            kwargs['specific_url'] = self.url
+        return kwargs
+
+
+def read_items_file(path):
+    """Read raw item dicts from a JSON items file
+    
+    Args:
+        path: JSON file holding a list of items or {"items": [...]}
         
-        # Extract max_images parameter
-        max_images = item.pop('max_images', 5)
+    Returns:
+        List of item dicts
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    if isinstance(data, dict) and 'items' in data:
+        data = data['items']
+    if not isinstance(data, list):
+        raise ValueError(f"{path} must be a JSON array or have an 'items' key")
+    return data
+
+
+def load_items(raw_items):
+    """Validate raw item dicts up front so bad config fails before any scraping
+    
+    Args:
+        raw_items: List of dicts with ScrapeItem fields
         
+    Returns:
+        List of ScrapeItem
+    """
+    items = []
+    for idx, raw in enumerate(raw_items, 1):
         try:
-            files = scraper.scrape_and_download(**item, max_images=max_images)
-            total_downloaded += len(files)
-            
-            print(f"✓ Downloaded {len(files)} images for this item")
+            if not isinstance(raw, dict):
+                raise TypeError("expected an object")
+            items.append(ScrapeItem(**{k: v for k, v in raw.items() if k not in IGNORED_ITEM_KEYS}))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid item {idx} ({raw!r}): {e}") from None
+    return items
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often scrapes may start"""
+    
+    def __init__(self, rate_per_min, capacity=1):
+        self.rate = rate_per_min / 60.0  # Tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Reserve the token now; a negative balance is the wait owed
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def _cache_key(item):
+    """Stable key for an item's search parameters"""
+    # hash(item) is salted per process, so it cannot key a cache on disk
+    fields = {k: v for k, v in asdict(item).items() if v is not None}
+    return hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+def _cached_files(cache, key, max_age):
+    """Return cached files for key if fresh and still on disk, else None"""
+    entry = cache.get(key)
+    if not entry or time.time() - entry['ts'] >= max_age:
+        return None
+    if not all(os.path.exists(f) for f in entry['files']):
+        return None
+    return entry['files']
+
+
+def _resolve(scraper, bucket, max_images, **kwargs):
+    """Search for one item's image URLs once the token bucket allows it
+    
+    Transient network errors, 429 and 5xx are retried with backoff by the
+    session's adapter (see build_session()), not here.
+    """
+    bucket.acquire()
+    return scraper.resolve_urls(**kwargs, max_images=max_images)
+
+
+def batch_scrape(items_file=DEFAULT_ITEMS_FILE, max_age=DEFAULT_MAX_AGE,
+                 rate_per_min=DEFAULT_RATE_PER_MIN, summary_csv=None):
+    """Process all items in the batch concurrently"""
+    items = load_items(read_items_file(items_file))
+    _setup_logging()
+    
+    # One pooled session (and HTTP/2 image client, if available) for the whole
+    # batch so connections stay alive between items
+    image_client = build_image_client()
+    try:
+        with build_session() as session:
+            scraper = ClothingImageScraper(download_path=DOWNLOAD_DIR, session=session,
+                                           image_client=image_client)
+            try:
+                with shelve.open(CACHE_FILE) as cache:
+                    results = _run_batch(items, scraper, cache, max_age, TokenBucket(rate_per_min))
+            finally:
+                scraper.close()
+    finally:
+        if image_client is not None:
+            image_client.close()
+    
+    _report(results, summary_csv)
+
+
+def _report(results, summary_csv=None):
+    """Log one summary for the whole batch and optionally write it as CSV
+    
+    Args:
+        results: List of (idx, item, files or exception, cached) in item order
+        summary_csv: Optional path for a per-item CSV summary
+    """
+    ok = sum(1 for _, _, r, _ in results if not isinstance(r, Exception))
+    total = sum(len(r) for _, _, r, _ in results if not isinstance(r, Exception))
+    cached = sum(1 for *_, c in results if c)
+    
+    log.info(f"\n{'='*60}")
+    log.info(f"Batch processing complete!")
+    log.info(f"Items: {ok}/{len(results)} succeeded ({cached} from cache)")
+    log.info(f"Total images downloaded: {total}")
+    log.info(f"{'='*60}")
+    
+    if summary_csv:
+        rows = []
+        for idx, item, r, was_cached in results:
+            failed = isinstance(r, Exception)
+            rows.append([idx, item.brand or '', item.model or '', item.style or '', item.color or '',
+                         'error' if failed else ('cached' if was_cached else 'ok'),
+                         0 if failed else len(r),
+                         str(r) if failed else ';'.join(r)])
+        with open(summary_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['item', 'brand', 'model', 'style', 'color', 'status', 'num_images', 'files_or_error'])
+            writer.writerows(rows)
+        log.info(f"Summary written to {summary_csv}")
+
+
+def _run_batch(items, scraper, cache, max_age, bucket):
+    """Scrape every item with the given scraper, reusing fresh cached results
+    
+    Returns:
+        List of (idx, item, files or exception, cached) sorted by idx
+    """
+    # Per-item outcomes are collected here and summarised once at the end
+    results = []
+    progress = tqdm(total=len(items), desc="items", unit="item") if TQDM_AVAILABLE else None
+    
+    # The shelf is only touched from this thread; workers just scrape.
+    # Searches and downloads run on separate pools so a worker that finishes
+    # an item's search moves straight on to the next item instead of idling
+    # through that item's image downloads.
+    resolving = {}
+    downloading = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ITEMS) as pool, \
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as dl_pool:
+        for idx, item in enumerate(items, 1):
+            key = _cache_key(item)
+            if max_age > 0:
+                files = _cached_files(cache, key, max_age)
+                if files is not None:
+                    results.append((idx, item, files, True))
+                    log.debug(f"✓ Using {len(files)} cached images for item {idx}")
+                    if progress:
+                        progress.update()
+                    continue
             
-        except Exception as e:
-            print(f"✗ Error processing item: {e}")
+            log.debug(f"Queued item {idx}/{len(items)}")
+            fut = pool.submit(_resolve, scraper, bucket, item.max_images,
+                              **item.search_kwargs())
+            resolving[fut] = (idx, key, item)
         
-        # Be polite - wait between items
-        if idx < len(items_to_scrape):
-            print("\nWaiting before next item...")
-            time.sleep(2)
+        # Politeness comes from the worker bound and the token bucket, not fixed sleeps
+        while resolving or downloading:
+            done, _ = wait(list(resolving) + list(downloading), return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut in resolving:
+                    idx, key, item = resolving.pop(fut)
+                    try:
+                        plan = fut.result()
+                    except Exception as e:
+                        results.append((idx, item, e, False))
+                        log.error(f"✗ Error searching item {idx}: {e}")
+                        if progress:
+                            progress.update()
+                        continue
+                    downloading[dl_pool.submit(scraper.download_urls, plan, item.max_images)] = (idx, key, item)
+                    continue
+                
+                idx, key, item = downloading.pop(fut)
+                try:
+                    files = fut.result().get('files', [])
+                    if files:
+                        cache[key] = {'ts': time.time(), 'files': files}
+                    results.append((idx, item, files, False))
+                    log.debug(f"✓ Downloaded {len(files)} images for item {idx}")
+                    
+                except Exception as e:
+                    results.append((idx, item, e, False))
+                    log.error(f"✗ Error processing item {idx}: {e}")
+                if progress:
+                    progress.update()
+    
+    if progress:
+        progress.close()
+    results.sort(key=lambda r: r[0])
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch scrape the items listed in a JSON file')
+    parser.add_argument('items_file', nargs='?', default=DEFAULT_ITEMS_FILE,
+                       help=f'JSON file with the items to scrape (default: {DEFAULT_ITEMS_FILE})')
+    parser.add_argument('--max-age', type=int, default=DEFAULT_MAX_AGE,
+                       help=f'Reuse cached results younger than this many seconds, 0 disables (default: {DEFAULT_MAX_AGE})')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE_PER_MIN,
+                       help=f'Maximum item scrapes started per minute (default: {DEFAULT_RATE_PER_MIN})')
+    parser.add_argument('--summary-csv', type=str, default=None,
+                       help='Also write a per-item summary to this CSV file')
+    args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error('--rate must be positive')
     
-    print(f"\n{'='*60}")
-    print(f"Batch processing complete!")
-    print(f"Total images downloaded: {total_downloaded}")
-    print(f"{'='*60}")
+    try:
+        batch_scrape(args.items_file, max_age=args.max_age, rate_per_min=args.rate,
+                     summary_csv=args.summary_csv)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
-    batch_scrape()
+    main()
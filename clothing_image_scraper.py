@@ -14,12 +14,24 @@ Enhanced with:
 import os
 import re
 import json
+import shutil
+import hashlib
+import html
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote_plus, urljoin, urlparse, unquote, parse_qs, urlencode
 from bs4 import BeautifulSoup
 import time
+from io import BytesIO
 from pathlib import Path
 import argparse
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, chain
+from functools import lru_cache
+from collections import OrderedDict
 
 try:
     from openpyxl import Workbook
@@ -32,7 +44,7 @@ except ImportError:
     print("Install with: pip install openpyxl")
 
 try:
-    from PIL import Image as PILImage
+    from PIL import Image as PILImage, ImageFile
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
@@ -49,24 +61,449 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# urllib3 only decodes Brotli bodies when a brotli module is importable, so
+# only advertise 'br' when we can actually decompress it
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+ACCEPT_ENCODING = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+# orjson parses JSON-LD blocks several times faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# lxml's C parser is several times faster than the pure-Python html.parser
+try:
+    import lxml.etree
+    import lxml.html
+    LXML_AVAILABLE = True
+    HTML_PARSER = 'lxml'
+except ImportError:
+    LXML_AVAILABLE = False
+    HTML_PARSER = 'html.parser'
+
+# requests only speaks HTTP/1.1; httpx with h2 lets image bursts to one CDN
+# share a single multiplexed connection
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 from scraper_config import (
     CONFIDENCE_THRESHOLD, HASH_SIMILARITY_THRESHOLD, HASH_INDEX_FILE,
     MIN_IMAGE_WIDTH, MIN_IMAGE_HEIGHT, MIN_LOW_RES_WIDTH, MIN_LOW_RES_HEIGHT,
-    LOW_RES_SUBFOLDER, METHOD_TIMEOUT,
+    LOW_RES_SUBFOLDER, METHOD_TIMEOUT, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+    PER_HOST_CONCURRENCY, DOWNLOAD_CHUNK_SIZE, DOWNLOAD_HEADER_PEEK, MIN_IMAGE_BYTES,
+    MAX_PARALLEL_DOWNLOADS, DOWNLOAD_HOST_DELAY, HTTP2_IMAGES,
+    RETAILER_SEARCH_WORKERS, HTTP_RETRIES, HTTP_RETRY_BACKOFF, PAGE_CACHE_SIZE,
     RELIABLE_RETAILERS, URL_SIZE_PATTERNS, HIGHRES_ATTRIBUTES,
     SITE_SPECIFIC_SEARCHES, OCR_ENABLED, OCR_CONFIDENCE_BOOST,
-    BROWSER_HEADLESS, BROWSER_TIMEOUT,
+    OCR_MAX_EDGE, OCR_TESSERACT_CONFIG,
+    BROWSER_HEADLESS, BROWSER_TIMEOUT, BROWSER_BLOCKED_RESOURCES,
+    BROWSER_NAV_TIMEOUT, BROWSER_IMAGE_WAIT, BROWSER_SCROLL_STEPS, BROWSER_SCROLL_PAUSE,
+    BROWSER_SKIP_MIN_IMAGES, MOBILE_USER_AGENT, MOBILE_GOOGLE_PAGES,
 )
 from image_hash_index import ImageHashIndex
 
 
+# Characters invalid in Windows filenames are dropped and spaces become
+# underscores, in a single str.translate pass
+_FILENAME_TRANS = str.maketrans({' ': '_', **{c: None for c in '<>:"/\\|?*'}})
+
+# URL upgrade patterns, compiled once. Alternatives keep URL_SIZE_PATTERNS
+# order so overlapping entries resolve as the old sequential replaces did.
+_SIZE_SUFFIX_RE = re.compile('|'.join(map(re.escape, URL_SIZE_PATTERNS['suffixes_to_remove'])))
+_PATH_SEGMENT_RE = re.compile('|'.join(map(re.escape, URL_SIZE_PATTERNS['path_replacements'])))
+_AMAZON_SIZE_RE = re.compile(r'\._[A-Z]{2}[_A-Z]*(?:SR|SX|SY|SL|SS|CR|UX|UY)\d+[,\d]*_?')
+_IMAGE_EXT_RE = re.compile(r'\.(jpe?g|png|webp|gif)(\?|$)', re.I)
+# One srcset entry: URL plus optional width descriptor (x-descriptors count as 0)
+_SRCSET_RE = re.compile(r'\s*([^\s,]+)(?:\s+(\d+)w)?[^,]*')
+_RELIABLE_RETAILER_RE = re.compile('|'.join(map(re.escape, RELIABLE_RETAILERS)), re.I)
+# Icon/vector/animation formats the browser scrape skips, matched anywhere in the URL
+_SKIPPED_IMAGE_EXT_RE = re.compile(r'\.(?:svg|gif|ico)', re.I)
+# Structured-data image sources, read straight from the page bytes
+_JSONLD_BYTES_RE = re.compile(rb'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+_OG_IMAGE_BYTES_RE = re.compile(rb'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)', re.I)
+
+# Product image class/id matchers for the page extractors
+_TJX_IMAGE_RE = re.compile(r'product.*image|slide.*image', re.I)
+_MACYS_IMAGE_RE = re.compile(r'productImage|mainImage', re.I)
+_AMAZON_IMAGE_RE = re.compile(r'product|main', re.I)
+_PRODUCT_IMAGE_RE = re.compile(r'product.*image', re.I)
+_GALLERY_IMAGE_RE = re.compile(r'gallery.*image', re.I)
+_ZOOM_IMAGE_RE = re.compile(r'zoom.*image', re.I)
+
+# Path fragments marking product links on retailer search result pages
+_PRODUCT_LINK_KEYWORDS = ('/product/', '/p/', '/item/', '/dp/', '/pd/')
+_REVERSIBLE_LINK_KEYWORDS = ('/products/', '/items/')
+
+
+def _href_xpath(keywords, ignore_case=False):
+    """
+    Compile an XPath selecting the hrefs of links containing any keyword,
+    so libxml2 filters the anchors instead of Python.
+
+    Args:
+        keywords: Substrings to look for in href
+        ignore_case: Lowercase href before matching (keywords must be lowercase)
+
+    Returns:
+        lxml.etree.XPath, or None when lxml is not installed
+    """
+    if not LXML_AVAILABLE:
+        return None
+    href = "translate(@href, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')" if ignore_case else '@href'
+    predicate = ' or '.join(f'contains({href}, "{k}")' for k in keywords)
+    return lxml.etree.XPath(f'//a[{predicate}]/@href')
+
+
+_PRODUCT_LINK_XPATH = _href_xpath(_PRODUCT_LINK_KEYWORDS, ignore_case=True)
+_REVERSIBLE_LINK_XPATH = _href_xpath(_REVERSIBLE_LINK_KEYWORDS)
+
+
+def _class_search(regex, classes):
+    """
+    Match a class regex the way BeautifulSoup's find_all does: against
+    each class on its own, then against the space-joined list.
+
+    Args:
+        regex: Compiled pattern
+        classes: A tag's 'class' attribute (list, str or None)
+
+    Returns:
+        True if the pattern matches
+    """
+    if not classes:
+        return False
+    if isinstance(classes, str):
+        return regex.search(classes) is not None
+    return (any(regex.search(c) for c in classes)
+            or regex.search(' '.join(classes)) is not None)
+
+
+
+# Query building and retailer URL lists are pure functions of their inputs;
+# cache them since exhaustive search and batch re-runs repeat the same items.
+# Tuples keep the cached values immutable; the methods hand out list copies.
+@lru_cache(maxsize=512)
+def _build_search_queries(brand, barcode, model, color, style):
+    """Cached body of ClothingImageScraper.build_optimized_search_queries."""
+    queries = []
+
+    # Rule 1: Brand + Model + Color
+    if brand and model and color:
+        queries.append(f"{brand} {model} {color}")
+    elif brand and model:
+        queries.append(f"{brand} {model}")
+
+    # Rule 2: Brand + UPC/Barcode
+    if brand and barcode:
+        queries.append(f"{brand} {barcode}")
+    elif barcode:
+        queries.append(barcode)
+
+    # Rule 3: Brand + Style + Color
+    if brand and style and color:
+        queries.append(f"{brand} {style} {color}")
+    elif brand and style:
+        queries.append(f"{brand} {style}")
+
+    # Fallback: Just brand if nothing else
+    if not queries and brand:
+        queries.append(brand)
+
+    return tuple(queries)
+
+
+@lru_cache(maxsize=512)
+def _retailer_search_urls(query):
+    """Cached body of ClothingImageScraper.search_specific_retailers."""
+    urls = []
+    encoded_query = quote_plus(query)
+
+    # Most Accessible Shoe Retailers (usually work)
+    urls.append(('Zappos', f"https://www.zappos.com/search?term={encoded_query}"))
+    urls.append(('DSW', f"https://www.dsw.com/en/us/search?q={encoded_query}"))
+    urls.append(('Amazon', f"https://www.amazon.com/s?k={encoded_query}"))
+    urls.append(('eBay', f"https://www.ebay.com/sch/i.html?_nkw={encoded_query}"))
+
+    # Department Stores & Fashion Retailers
+    urls.append(('Belk', f"https://www.belk.com/search/?q={encoded_query}"))
+    urls.append(('Forever 21', f"https://www.forever21.com/us/search?q={encoded_query}"))
+    urls.append(('Lord & Taylor', f"https://www.lordandtaylor.com/search?q={encoded_query}"))
+
+    # Luxury Fashion Aggregators & Marketplaces
+    urls.append(('ModeSens', f"https://modesens.com/search/?q={encoded_query}"))
+    urls.append(('Clothbase', f"https://clothbase.com/search?q={encoded_query}"))
+    urls.append(('Editorialist', f"https://editorialist.com/search?q={encoded_query}"))
+    urls.append(('Brands Gateway', f"https://brandsgateway.com/search?q={encoded_query}"))
+    urls.append(('Hello Luxy', f"https://www.helloluxy.com/search?q={encoded_query}"))
+    urls.append(('Banter', f"https://www.banter.com/search?q={encoded_query}"))
+
+    # Additional Luxury/Fashion Shoe Sites
+    urls.append(('Level Shoes', f"https://us.levelshoes.com/search?q={encoded_query}"))
+    urls.append(('Beyond Style', f"https://www.beyondstyle.us/search?q={encoded_query}"))
+    urls.append(('YOOX', f"https://www.yoox.com/us/search?q={encoded_query}"))
+    urls.append(('The BS', f"https://www.thebs.com/search?q={encoded_query}"))
+    urls.append(('Fetching', f"https://fetching.co.kr/search?q={encoded_query}"))
+
+    # Brand Direct Sites (when brand is detected)
+    query_lower = query.lower()
+    if 'nike' in query_lower:
+        urls.append(('Nike', f"https://www.nike.com/w?q={encoded_query}"))
+    if 'adidas' in query_lower:
+        urls.append(('Adidas', f"https://www.adidas.com/us/search?q={encoded_query}"))
+    if 'puma' in query_lower:
+        urls.append(('Puma', f"https://us.puma.com/us/en/search?q={encoded_query}"))
+    if 'new balance' in query_lower:
+        urls.append(('New Balance', f"https://www.newbalance.com/search/?q={encoded_query}"))
+    if 'converse' in query_lower:
+        urls.append(('Converse', f"https://www.converse.com/shop?q={encoded_query}"))
+    if 'vans' in query_lower:
+        urls.append(('Vans', f"https://www.vans.com/shop/search?q={encoded_query}"))
+    if 'stuart weitzman' in query_lower:
+        urls.append(('Stuart Weitzman', f"https://www.stuartweitzman.com/search/?q={encoded_query}"))
+    if 'sam edelman' in query_lower:
+        urls.append(('Sam Edelman', f"https://www.samedelman.com/search?q={encoded_query}"))
+    if 'steve madden' in query_lower:
+        urls.append(('Steve Madden', f"https://www.stevemadden.com/search?q={encoded_query}"))
+
+    # General Accessible Retailers
+    urls.append(('Walmart', f"https://www.walmart.com/search?q={encoded_query}"))
+    urls.append(('Target', f"https://www.target.com/s?searchTerm={encoded_query}"))
+    urls.append(('6pm', f"https://www.6pm.com/search?term={encoded_query}"))
+
+    return tuple(urls)
+
+
+
+# Read every <img>'s attributes (src, data-src, data-zoom-image,
+# data-highres, width, height) and the first 20 link hrefs in one page
+# evaluation each, instead of one browser round trip per attribute
+_BROWSER_IMAGES_JS = """() => Array.from(document.images, i => [
+    i.getAttribute('src'), i.getAttribute('data-src'), i.getAttribute('data-zoom-image'),
+    i.getAttribute('data-highres'), i.getAttribute('width'), i.getAttribute('height')])"""
+_BROWSER_LINKS_JS = """() => Array.from(document.querySelectorAll('a[href]'),
+    a => a.getAttribute('href')).slice(0, 20)"""
+# Scroll a viewport at a time until a scroll adds no <img> (or steps run out)
+_BROWSER_SCROLL_JS = """async ([steps, pause]) => {
+    let count = document.images.length;
+    for (let i = 0; i < steps; i++) {
+        window.scrollBy(0, window.innerHeight);
+        await new Promise(r => setTimeout(r, pause));
+        if (document.images.length === count) break;
+        count = document.images.length;
+    }
+}"""
+
+
+@lru_cache(maxsize=65536)
+def _image_signature(url):
+    """
+    Cached body of ClothingImageScraper._create_image_signature. Every
+    discovery method signs every candidate, and the same URLs keep coming
+    back (Shopping vs Images, page re-scans, upgrades).
+    """
+    parsed = urlparse(url)
+    # Use domain + path as signature (ignore query parameters that might differ)
+    signature = f"{parsed.netloc}{parsed.path}"
+
+    # Also check for common image filename patterns
+    if '/' in signature:
+        # Remove size/quality parameters from filename
+        filename = signature.rsplit('/', 1)[-1].split('_', 1)[0]
+        signature = f"{parsed.netloc}/{filename}"
+
+    return signature
+
+
+@lru_cache(maxsize=16384)
+def _relevance_score(pattern, img_url, source_url, page_title, alt_text, surrounding_text):
+    """
+    Cached body of ClothingImageScraper._verify_image_relevance. Items in
+    a batch often share identifiers (same model in several colours), so
+    the same candidate URLs get scored against the same pattern again.
+
+    Returns:
+        Tuple of (score, reasons tuple); callers copy reasons into a list
+    """
+    score = 0.0
+    reasons = []
+
+    # +0.3 if page title or source URL contains brand or model
+    m = pattern.search(page_title) or pattern.search(source_url)
+    if m:
+        score += 0.3
+        reasons.append(f'page_title_or_url_match:{m.group(0).lower()}')
+
+    # +0.2 if image alt text contains any identifier
+    m = pattern.search(alt_text)
+    if m:
+        score += 0.2
+        reasons.append(f'alt_text_match:{m.group(0).lower()}')
+
+    # +0.2 if image URL/filename contains any identifier
+    m = pattern.search(img_url)
+    if m:
+        score += 0.2
+        reasons.append(f'img_url_match:{m.group(0).lower()}')
+
+    # +0.2 if surrounding text contains identifiers
+    m = pattern.search(surrounding_text)
+    if m:
+        score += 0.2
+        reasons.append(f'surrounding_text_match:{m.group(0).lower()}')
+
+    # +0.1 if source is a known reliable retailer
+    m = _RELIABLE_RETAILER_RE.search(source_url) or _RELIABLE_RETAILER_RE.search(img_url)
+    if m:
+        score += 0.1
+        reasons.append(f'reliable_retailer:{m.group(0).lower()}')
+
+    # OCR verification boost (on already-downloaded images, called separately)
+    # This is handled in _ocr_verify_image() after download
+
+    return score, tuple(reasons)
+
+
+def _url_origin(url):
+    """Return the scheme://host prefix that root-relative paths resolve against."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _absolute_url(src, origin):
+    """
+    Resolve a protocol-relative or root-relative image src.
+
+    Args:
+        src: Image src as found on the page
+        origin: _url_origin() of the page, computed once per page
+
+    Returns:
+        Absolute URL, or src unchanged if it is neither form
+    """
+    prefix = src[:2]
+    if prefix == '//':
+        return 'https:' + src
+    if prefix[:1] == '/':
+        return origin + src
+    return src
+
+
+@lru_cache(maxsize=4096)
+def _upgraded_url(url):
+    """
+    Cached body of ClothingImageScraper._upgrade_image_url. The same image
+    URL is upgraded by several discovery methods and again on the page it
+    came from, so each distinct URL is rewritten only once.
+    """
+    upgraded = url
+
+    # Handle Amazon CDN image sizing patterns
+    # e.g., ._AC_SR146,146_ or ._SL1500_ or ._AC_SX679_ → ._AC_SL1500_
+    if 'media-amazon.com' in upgraded or 'images-amazon.com' in upgraded:
+        upgraded = _AMAZON_SIZE_RE.sub('._AC_SL1500_', upgraded)
+        # Also fix truncated URLs missing file extension
+        if not _IMAGE_EXT_RE.search(upgraded):
+            upgraded += '.jpg'
+
+    # Remove size suffixes from filename
+    upgraded = _SIZE_SUFFIX_RE.sub('', upgraded)
+
+    # Replace path segments
+    path_replacements = URL_SIZE_PATTERNS['path_replacements']
+    upgraded = _PATH_SEGMENT_RE.sub(lambda m: path_replacements[m.group(0)], upgraded)
+
+    # Modify query parameters for larger dimensions (most URLs have none,
+    # so skip the parse for them)
+    parsed = urlparse(upgraded) if '?' in upgraded else None
+    if parsed is not None and parsed.query:
+        params = parse_qs(parsed.query, keep_blank_values=True)
+        changed = False
+        for param_name, new_val in URL_SIZE_PATTERNS['param_upgrades'].items():
+            if param_name in params:
+                params[param_name] = [new_val]
+                changed = True
+        if changed:
+            # Rebuild URL with updated params
+            flat_params = {k: v[0] for k, v in params.items()}
+            new_query = urlencode(flat_params)
+            upgraded = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{new_query}"
+
+    return upgraded
+
+
+def build_session():
+    """
+    Create a requests.Session with a pooled keep-alive adapter.
+
+    Share one session across scrapers (e.g. a whole batch) so repeat requests
+    to the same host reuse open TCP/TLS connections instead of reconnecting.
+    Connection errors, 429 and 5xx are retried by urllib3 with exponential
+    backoff, honouring Retry-After.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    # raise_on_status=False hands the last 429/503 back to the caller, which
+    # still needs to see challenge pages for CAPTCHA detection
+    retry = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF,
+                  status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def build_image_client():
+    """
+    Create an HTTP/2 client for image downloads, if httpx[http2] is installed.
+
+    Like build_session(), share one client across scrapers so concurrent
+    downloads from the same CDN multiplex over one TCP/TLS connection.
+
+    Returns:
+        httpx.Client, or None if HTTP/2 is disabled or unavailable
+    """
+    if not (HTTP2_IMAGES and HTTPX_AVAILABLE):
+        return None
+    limits = httpx.Limits(max_connections=HTTP_POOL_MAXSIZE,
+                          max_keepalive_connections=HTTP_POOL_CONNECTIONS)
+    return httpx.Client(http2=True, limits=limits, timeout=15, follow_redirects=True)
+
+
+def _http2_headers(headers):
+    """Drop the connection-specific headers HTTP/2 forbids."""
+    return {k: v for k, v in headers.items()
+            if k.lower() not in ('connection', 'keep-alive', 'upgrade')}
+
+
 class ClothingImageScraper:
-    def __init__(self, download_path="./downloaded_images"):
+    def __init__(self, download_path="./downloaded_images", session=None, image_client=None):
         """
         Initialize the scraper with a download path
 
         Args:
             download_path: Directory where images will be saved
+            session: Optional shared requests.Session (see build_session());
+                     a new pooled session is created if omitted
+            image_client: Optional shared HTTP/2 client (see build_image_client());
+                          one is created if omitted and httpx[http2] is installed
         """
         self.download_path = Path(download_path)
         self.download_path.mkdir(parents=True, exist_ok=True)
@@ -87,7 +524,7 @@ class ClothingImageScraper:
         self.base_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -101,19 +538,52 @@ class ClothingImageScraper:
             'sec-ch-ua-platform': '"Windows"'
         }
 
-        self.session = requests.Session()
+        self.session = session if session is not None else build_session()
+        self.image_client = image_client if image_client is not None else build_image_client()
         self.current_user_agent_index = 0
         self._update_headers()
 
+        # Per-host request slots: host -> BoundedSemaphore(PER_HOST_CONCURRENCY)
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+        # Per-host politeness: host -> earliest monotonic time of its next download
+        self._host_next_start = {}
+
         # List of sites known to block automated requests
         self.protected_sites = [
             'macys.com', 'bloomingdales.com', 'neimanmarcus.com',
             'tjmaxx.com', 'marshalls.com', 'nordstrom.com'
         ]
 
+        # Retailer site name (a label of the page host, so www.nordstrom.com,
+        # m.macys.com and amazon.co.uk all match) -> (fast high-res extractor
+        # tried before the generic walk, page image extractor); None falls
+        # back to the generic version of that step
+        self._retailer_extractors = {
+            'amazon': (self._extract_amazon, self._extract_amazon_images),
+            'nordstrom': (self._extract_jsonld_product, self._extract_nordstrom_images),
+            'macys': (self._extract_jsonld_product, self._extract_macys_images),
+            'zappos': (self._extract_jsonld_product, self._extract_zappos_images),
+            '6pm': (self._extract_jsonld_product, None),
+            'dsw': (self._extract_jsonld_product, None),
+            'nike': (self._extract_jsonld_product, self._extract_nike_images),
+            'adidas': (self._extract_jsonld_product, None),
+            'target': (self._extract_jsonld_product, None),
+            'walmart': (self._extract_jsonld_product, None),
+            'tjmaxx': (None, self._extract_tjx_images),
+            'marshalls': (None, self._extract_tjx_images),
+        }
+
         # Track downloads for reporting
         self.download_report = []
 
+        # Image URL -> saved path, shared by every item this scraper processes
+        self._downloaded_urls = {}
+
+        # Product page URL -> its high-res image URLs (LRU, PAGE_CACHE_SIZE)
+        self._page_highres = OrderedDict()
+        self._page_highres_lock = threading.Lock()
+
         # Initialize perceptual hash index
         hash_index_path = self.download_path / HASH_INDEX_FILE
         self.hash_index = ImageHashIndex(
@@ -130,6 +600,13 @@ class ClothingImageScraper:
         self.captcha_stats = {'detected': 0, 'urls': []}  # CAPTCHA tracking
         self.low_res_stats = {'saved': 0, 'items_low_res_only': 0}
 
+        # Playwright browser, launched on first use and reused across items
+        # (see _browser_thread); released by close()
+        self._playwright = None
+        self._browser = None
+        self._browser_executor = None
+        self._browser_lock = threading.Lock()
+
     def _update_headers(self):
         """Update session headers with a new user agent"""
         headers = self.base_headers.copy()
@@ -138,6 +615,45 @@ class ClothingImageScraper:
         # Rotate to next user agent
         self.current_user_agent_index = (self.current_user_agent_index + 1) % len(self.user_agents)
 
+    def _host_slot(self, url):
+        """
+        Get the semaphore bounding concurrent requests to a URL's host.
+
+        Concurrency is capped per origin, so parallel items and downloads
+        can saturate many CDNs without stacking up on any single one.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            threading.BoundedSemaphore shared by all requests to that host
+        """
+        host = urlparse(url).netloc.lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+        return slot
+
+    def _pace_host(self, url):
+        """
+        Wait until DOWNLOAD_HOST_DELAY has passed since the last download
+        from this URL's host was started, reserving the next start time.
+
+        Politeness is per host, so downloads from different CDNs never wait
+        on each other.
+
+        Args:
+            url: URL about to be downloaded
+        """
+        host = urlparse(url).netloc.lower()
+        with self._host_slots_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_start.get(host, now))
+            self._host_next_start[host] = start + DOWNLOAD_HOST_DELAY
+        if start > now:
+            time.sleep(start - now)
+
     def _make_request(self, url, timeout=15, retries=2):
         """
         Make a request with anti-detection measures
@@ -145,64 +661,74 @@ class ClothingImageScraper:
         Args:
             url: URL to request
             timeout: Request timeout
-            retries: Number of retries on failure
+            retries: Attempts on 403/CAPTCHA, each with a fresh user agent
+                     (network errors are retried by the session adapter)
 
         Returns:
             Response object or None
         """
         for attempt in range(retries):
-            try:
-                # Rotate user agent for each attempt
-                self._update_headers()
+            # Rotate user agent for each attempt
+            self._update_headers()
 
-                # Add referer to make it look like we came from Google
-                headers = self.session.headers.copy()
-                headers['Referer'] = 'https://www.google.com/'
+            # Add referer to make it look like we came from Google
+            headers = self.session.headers.copy()
+            headers['Referer'] = 'https://www.google.com/'
 
+            try:
                 # Make request with longer timeout
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout,
-                    allow_redirects=True
-                )
-
-                # Check for CAPTCHA before returning
-                is_captcha, captcha_type = self._detect_captcha(response)
-                if is_captcha:
-                    self._log_captcha(url, captcha_type)
-                    solved = self._try_solve_captcha(url, captcha_type, response)
-                    if solved:
-                        return solved
-                    # CAPTCHA not solvable — treat as failure
-                    if attempt < retries - 1:
-                        time.sleep(3)  # Longer delay after CAPTCHA
-                        continue
-                    return None
-
-                # If successful, return
-                if response.status_code == 200:
-                    return response
-                elif response.status_code == 403:
-                    # Try again with different user agent
-                    time.sleep(1)
-                    continue
-                else:
-                    response.raise_for_status()
+                with self._host_slot(url):
+                    response = self.session.get(
+                        url,
+                        headers=headers,
+                        timeout=timeout,
+                        allow_redirects=True
+                    )
+            except requests.exceptions.RequestException:
+                # Timeouts, connection errors, 429 and 5xx were already
+                # retried with backoff by the session's adapter
+                return None
 
-            except requests.exceptions.Timeout:
+            # Check for CAPTCHA before returning
+            is_captcha, captcha_type = self._detect_captcha(response)
+            if is_captcha:
+                self._log_captcha(url, captcha_type)
+                solved = self._try_solve_captcha(url, captcha_type, response)
+                if solved:
+                    return solved
+                # CAPTCHA not solvable — treat as failure
                 if attempt < retries - 1:
-                    time.sleep(2)
+                    time.sleep(3)  # Longer delay after CAPTCHA
                     continue
                 return None
-            except requests.exceptions.RequestException:
-                if attempt < retries - 1:
-                    time.sleep(2)
-                    continue
+
+            # If successful, return
+            if response.status_code == 200:
+                return response
+            elif response.status_code == 403:
+                # Try again with different user agent, backing off each time
+                time.sleep(2 ** attempt)
+                continue
+            else:
                 return None
 
         return None
 
+    def _parse(self, response):
+        """
+        Parse a response body into BeautifulSoup with the fastest available parser.
+
+        Parses the raw bytes so requests does not decode the body to text
+        again; the declared charset is still honoured.
+
+        Args:
+            response: requests.Response
+
+        Returns:
+            BeautifulSoup object
+        """
+        return BeautifulSoup(response.content, HTML_PARSER, from_encoding=response.encoding)
+
     def _log_method_stat(self, method_name, success, elapsed):
         """Track per-method statistics."""
         if method_name not in self.method_stats:
@@ -231,6 +757,24 @@ class ClothingImageScraper:
         'px-captcha',  # PerimeterX
         'datadome',  # DataDome
     ]
+    # All signatures as one case-insensitive alternation: a single scan per page
+    _CAPTCHA_RE = re.compile('|'.join(map(re.escape, CAPTCHA_SIGNATURES)), re.IGNORECASE)
+    # Same alternation over raw bytes: the signatures are ASCII, so responses
+    # can be checked without decoding the body to text
+    _CAPTCHA_BYTES_RE = re.compile(b'|'.join(re.escape(sig.encode()) for sig in CAPTCHA_SIGNATURES), re.IGNORECASE)
+
+    # Every CAPTCHA widget selector in one query, so pages are walked once
+    _CAPTCHA_SELECTOR = ('.g-recaptcha, [data-sitekey*="recaptcha"], .h-captcha, .cf-turnstile, '
+                         '#px-captcha, #distilCaptchaForm, #captcha, .captcha, [data-sitekey]')
+    # Widget types in reporting priority, each with a test on a matched element
+    _CAPTCHA_ELEMENT_TYPES = (
+        ('reCAPTCHA', lambda el, cls: 'g-recaptcha' in cls or 'recaptcha' in (el.get('data-sitekey') or '')),
+        ('hCaptcha', lambda el, cls: 'h-captcha' in cls),
+        ('Cloudflare', lambda el, cls: 'cf-turnstile' in cls),
+        ('PerimeterX', lambda el, cls: el.get('id') == 'px-captcha'),
+        ('Distil', lambda el, cls: el.get('id') == 'distilCaptchaForm'),
+        ('element-detected', lambda el, cls: True),
+    )
 
     def _detect_captcha(self, response):
         """
@@ -252,37 +796,63 @@ class ClothingImageScraper:
             # These could be CAPTCHA but also normal blocks — check content
             pass
 
-        content_lower = response.text[:5000].lower() if response.text else ''
+        body = response.content or b''
+        content = body[:5000]
 
         # Check for CAPTCHA signatures in the page content
-        for sig in self.CAPTCHA_SIGNATURES:
-            if sig in content_lower:
-                # Determine CAPTCHA type
-                if 'recaptcha' in content_lower or 'g-recaptcha' in content_lower:
-                    return True, 'reCAPTCHA'
-                elif 'hcaptcha' in content_lower:
-                    return True, 'hCaptcha'
-                elif 'cf-challenge' in content_lower or 'cf-turnstile' in content_lower:
-                    return True, 'Cloudflare'
-                elif 'px-captcha' in content_lower:
-                    return True, 'PerimeterX'
-                elif 'datadome' in content_lower:
-                    return True, 'DataDome'
-                elif 'distilcaptchebody' in content_lower:
-                    return True, 'Distil'
-                else:
-                    return True, 'generic'
+        if self._CAPTCHA_BYTES_RE.search(content):
+            # Only lowercase pages that matched, to determine CAPTCHA type
+            content_lower = content.lower()
+            if b'recaptcha' in content_lower or b'g-recaptcha' in content_lower:
+                return True, 'reCAPTCHA'
+            elif b'hcaptcha' in content_lower:
+                return True, 'hCaptcha'
+            elif b'cf-challenge' in content_lower or b'cf-turnstile' in content_lower:
+                return True, 'Cloudflare'
+            elif b'px-captcha' in content_lower:
+                return True, 'PerimeterX'
+            elif b'datadome' in content_lower:
+                return True, 'DataDome'
+            elif b'distilcaptchebody' in content_lower:
+                return True, 'Distil'
+            else:
+                return True, 'generic'
 
         # Check for very short pages with challenge-like headers
         if response.status_code in (403, 429, 503):
-            content_length = len(response.text) if response.text else 0
+            content_length = len(body)
             if content_length < 2000:
                 # Very short error page, likely a block/challenge
-                if any(h in response.headers.get('server', '').lower() for h in ['cloudflare', 'ddos-guard']):
+                server = response.headers.get('server', '').lower()
+                if any(h in server for h in ('cloudflare', 'ddos-guard')):
                     return True, 'WAF-block'
 
         return False, None
 
+    def _matching_hrefs(self, response, xpath, keywords, ignore_case=False):
+        """
+        Get the hrefs of a page's links that contain any keyword.
+
+        Args:
+            response: requests.Response of the page
+            xpath: Compiled XPath from _href_xpath (None without lxml)
+            keywords: Same substrings the XPath was built from
+            ignore_case: Whether the XPath lowercases href
+
+        Returns:
+            List of matching hrefs in document order
+        """
+        if xpath is not None:
+            return [str(href) for href in xpath(lxml.html.fromstring(response.content))]
+
+        hrefs = []
+        for a in self._parse(response).find_all('a', href=True):
+            href = a['href']
+            target = href.lower() if ignore_case else href
+            if any(keyword in target for keyword in keywords):
+                hrefs.append(href)
+        return hrefs
+
     def _detect_captcha_in_soup(self, soup):
         """
         Detect CAPTCHA indicators in a parsed BeautifulSoup page.
@@ -299,35 +869,30 @@ class ClothingImageScraper:
             return False, None
 
         # Check for CAPTCHA-related elements first (most reliable)
-        if soup.select_one('.g-recaptcha, [data-sitekey*="recaptcha"]'):
-            return True, 'reCAPTCHA'
-        if soup.select_one('.h-captcha'):
-            return True, 'hCaptcha'
-        if soup.select_one('.cf-turnstile'):
-            return True, 'Cloudflare'
-        if soup.select_one('#px-captcha'):
-            return True, 'PerimeterX'
-        if soup.select_one('#distilCaptchaForm'):
-            return True, 'Distil'
-        if soup.select_one('#captcha, .captcha, [data-sitekey]'):
-            return True, 'element-detected'
+        elements = soup.select(self._CAPTCHA_SELECTOR)
+        if elements:
+            # Report the highest-priority widget type present on the page
+            classified = [(el, el.get('class') or []) for el in elements]
+            for captcha_type, matches in self._CAPTCHA_ELEMENT_TYPES:
+                if any(matches(el, cls) for el, cls in classified):
+                    return True, captcha_type
 
         # Fall back to text-based detection
-        page_text = soup.get_text(separator=' ', strip=True)[:5000].lower()
-        for sig in self.CAPTCHA_SIGNATURES:
-            if sig in page_text:
-                if 'recaptcha' in page_text or 'g-recaptcha' in page_text:
-                    return True, 'reCAPTCHA'
-                elif 'hcaptcha' in page_text:
-                    return True, 'hCaptcha'
-                elif 'cloudflare' in page_text or 'cf-challenge' in page_text:
-                    return True, 'Cloudflare'
-                elif 'px-captcha' in page_text:
-                    return True, 'PerimeterX'
-                elif 'datadome' in page_text:
-                    return True, 'DataDome'
-                else:
-                    return True, 'generic'
+        page_text = soup.get_text(separator=' ', strip=True)[:5000]
+        if self._CAPTCHA_RE.search(page_text):
+            page_text = page_text.lower()
+            if 'recaptcha' in page_text or 'g-recaptcha' in page_text:
+                return True, 'reCAPTCHA'
+            elif 'hcaptcha' in page_text:
+                return True, 'hCaptcha'
+            elif 'cloudflare' in page_text or 'cf-challenge' in page_text:
+                return True, 'Cloudflare'
+            elif 'px-captcha' in page_text:
+                return True, 'PerimeterX'
+            elif 'datadome' in page_text:
+                return True, 'DataDome'
+            else:
+                return True, 'generic'
 
         return False, None
 
@@ -366,7 +931,27 @@ class ClothingImageScraper:
 
     # ── Image Verification ───────────────────────────────────────────────
 
-    def _verify_image_relevance(self, img_url, source_url, item_data, page_context=None):
+    def _prepare_item_ctx(self, item_data):
+        """
+        Preprocess an item's identifiers once for all of its candidate images.
+
+        Build it once per item and pass it to _verify_image_relevance and
+        _ocr_verify_image instead of letting each call rebuild it.
+
+        Args:
+            item_data: Dict with keys brand, model, style, color, barcode
+
+        Returns:
+            Tuple of (lowercased identifiers tuple, compiled case-insensitive
+            alternation or None if the item has no identifiers)
+        """
+        identifiers = tuple(item_data[key].lower() for key in ('brand', 'model', 'style', 'color', 'barcode')
+                            if item_data.get(key))
+        if not identifiers:
+            return identifiers, None
+        return identifiers, re.compile('|'.join(map(re.escape, identifiers)), re.IGNORECASE)
+
+    def _verify_image_relevance(self, img_url, source_url, item_data, page_context=None, item_ctx=None):
         """
         Verify that an image URL is relevant to the item being searched.
 
@@ -378,74 +963,28 @@ class ClothingImageScraper:
             source_url: The page URL where the image was found
             item_data: Dict with keys brand, model, style, color, barcode
             page_context: Optional dict with 'title', 'alt_text', 'surrounding_text', 'soup'
+            item_ctx: Optional result of _prepare_item_ctx(item_data), to avoid rebuilding it
 
         Returns:
             Tuple of (score: float, reasons: list of str)
         """
-        score = 0.0
-        reasons = []
-
-        # Build identifiers list from item data
-        identifiers = []
-        for key in ('brand', 'model', 'style', 'color', 'barcode'):
-            val = item_data.get(key)
-            if val:
-                identifiers.append(val.lower())
-
-        if not identifiers:
+        # One alternation of all identifiers, searched once per field
+        _, pattern = item_ctx or self._prepare_item_ctx(item_data)
+        if pattern is None:
             return 1.0, ['no_identifiers_to_check']
 
-        # Normalize for comparison
-        img_url_lower = img_url.lower()
-        source_url_lower = source_url.lower() if source_url else ''
-
+        source_url = source_url or ''
         page_title = ''
         alt_text = ''
         surrounding_text = ''
         if page_context:
-            page_title = (page_context.get('title') or '').lower()
-            alt_text = (page_context.get('alt_text') or '').lower()
-            surrounding_text = (page_context.get('surrounding_text') or '').lower()
-
-        # +0.3 if page title or source URL contains brand or model
-        for ident in identifiers:
-            if ident in page_title or ident in source_url_lower:
-                score += 0.3
-                reasons.append(f'page_title_or_url_match:{ident}')
-                break
-
-        # +0.2 if image alt text contains any identifier
-        for ident in identifiers:
-            if ident in alt_text:
-                score += 0.2
-                reasons.append(f'alt_text_match:{ident}')
-                break
-
-        # +0.2 if image URL/filename contains any identifier
-        for ident in identifiers:
-            if ident in img_url_lower:
-                score += 0.2
-                reasons.append(f'img_url_match:{ident}')
-                break
-
-        # +0.2 if surrounding text contains identifiers
-        for ident in identifiers:
-            if ident in surrounding_text:
-                score += 0.2
-                reasons.append(f'surrounding_text_match:{ident}')
-                break
+            page_title = page_context.get('title') or ''
+            alt_text = page_context.get('alt_text') or ''
+            surrounding_text = page_context.get('surrounding_text') or ''
 
-        # +0.1 if source is a known reliable retailer
-        for retailer in RELIABLE_RETAILERS:
-            if retailer in source_url_lower or retailer in img_url_lower:
-                score += 0.1
-                reasons.append(f'reliable_retailer:{retailer}')
-                break
-
-        # OCR verification boost (on already-downloaded images, called separately)
-        # This is handled in _ocr_verify_image() after download
-
-        return score, reasons
+        score, reasons = _relevance_score(pattern, img_url, source_url,
+                                          page_title, alt_text, surrounding_text)
+        return score, list(reasons)
 
     def _extract_ocr_text(self, filepath):
         """
@@ -462,16 +1001,17 @@ class ClothingImageScraper:
 
         try:
             with PILImage.open(filepath) as img:
-                # Convert to RGB if necessary (e.g., RGBA or palette images)
-                if img.mode not in ('L', 'RGB'):
-                    img = img.convert('RGB')
-                text = pytesseract.image_to_string(img, timeout=5)
+                # Tesseract works on luma anyway; a downscaled grayscale copy
+                # keeps label text legible at a fraction of the OCR cost
+                img = img.convert('L')
+                img.thumbnail((OCR_MAX_EDGE, OCR_MAX_EDGE), PILImage.LANCZOS)
+                text = pytesseract.image_to_string(img, timeout=5, config=OCR_TESSERACT_CONFIG)
                 return text.lower().strip()
         except Exception:
             # OCR failure should never block scraping
             return ''
 
-    def _ocr_verify_image(self, filepath, item_data):
+    def _ocr_verify_image(self, filepath, item_data, ocr_text=None, item_ctx=None):
         """
         Post-download OCR verification: extract text from image and check
         if it matches any item identifiers.
@@ -479,20 +1019,18 @@ class ClothingImageScraper:
         Args:
             filepath: Path to the downloaded image
             item_data: Dict with brand, model, style, color, barcode
+            ocr_text: Text already extracted by the download worker, if any
+            item_ctx: Optional result of _prepare_item_ctx(item_data)
 
         Returns:
             Tuple of (ocr_boost: float, ocr_text: str, matched_identifiers: list)
         """
-        ocr_text = self._extract_ocr_text(filepath)
+        if ocr_text is None:
+            ocr_text = self._extract_ocr_text(filepath)
         if not ocr_text:
             return 0.0, '', []
 
-        identifiers = []
-        for key in ('brand', 'model', 'style', 'color', 'barcode'):
-            val = item_data.get(key)
-            if val:
-                identifiers.append(val.lower())
-
+        identifiers, _ = item_ctx or self._prepare_item_ctx(item_data)
         if not identifiers:
             return 0.0, ocr_text, []
 
@@ -515,44 +1053,7 @@ class ClothingImageScraper:
         Returns:
             Upgraded URL (may be the same as input if no upgrades apply)
         """
-        upgraded = url
-
-        # Handle Amazon CDN image sizing patterns
-        # e.g., ._AC_SR146,146_ or ._SL1500_ or ._AC_SX679_ → ._AC_SL1500_
-        if 'media-amazon.com' in upgraded or 'images-amazon.com' in upgraded:
-            upgraded = re.sub(
-                r'\._[A-Z]{2}[_A-Z]*(?:SR|SX|SY|SL|SS|CR|UX|UY)\d+[,\d]*_?',
-                '._AC_SL1500_',
-                upgraded
-            )
-            # Also fix truncated URLs missing file extension
-            if not re.search(r'\.(jpe?g|png|webp|gif)(\?|$)', upgraded, re.I):
-                upgraded += '.jpg'
-
-        # Remove size suffixes from filename
-        for suffix in URL_SIZE_PATTERNS['suffixes_to_remove']:
-            if suffix in upgraded:
-                upgraded = upgraded.replace(suffix, '')
-
-        # Replace path segments
-        for old_seg, new_seg in URL_SIZE_PATTERNS['path_replacements'].items():
-            if old_seg in upgraded:
-                upgraded = upgraded.replace(old_seg, new_seg)
-
-        # Modify query parameters for larger dimensions
-        parsed = urlparse(upgraded)
-        if parsed.query:
-            params = parse_qs(parsed.query, keep_blank_values=True)
-            changed = False
-            for param_name, new_val in URL_SIZE_PATTERNS['param_upgrades'].items():
-                if param_name in params:
-                    params[param_name] = [new_val]
-                    changed = True
-            if changed:
-                # Rebuild URL with updated params
-                flat_params = {k: v[0] for k, v in params.items()}
-                new_query = urlencode(flat_params)
-                upgraded = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{new_query}"
+        upgraded = _upgraded_url(url)
 
         if upgraded != url:
             self.quality_stats['upgraded'] += 1
@@ -563,8 +1064,10 @@ class ClothingImageScraper:
         """
         Extract high-resolution image URLs from page using advanced techniques.
 
-        Checks srcset, high-res data attributes, og:image, twitter:image,
-        and JSON-LD structured data.
+        Pages from retailers in _retailer_extractors are read from their known
+        image location first; otherwise (or if that finds nothing) checks
+        srcset, high-res data attributes, og:image, twitter:image, and JSON-LD
+        structured data.
 
         Args:
             soup: BeautifulSoup object of the page
@@ -573,69 +1076,146 @@ class ClothingImageScraper:
         Returns:
             List of high-resolution image URLs
         """
-        highres_urls = []
-
-        # Check srcset attributes for highest resolution
-        for img in soup.find_all('img', {'srcset': True}):
-            srcset = img['srcset']
-            candidates = []
-            for entry in srcset.split(','):
-                parts = entry.strip().split()
-                if len(parts) >= 1:
-                    candidate_url = parts[0]
-                    width = 0
-                    if len(parts) >= 2 and parts[1].endswith('w'):
-                        try:
-                            width = int(parts[1][:-1])
-                        except ValueError:
-                            pass
-                    candidates.append((candidate_url, width))
-            if candidates:
-                # Pick the largest
-                candidates.sort(key=lambda x: x[1], reverse=True)
-                best = candidates[0][0]
-                if best.startswith('//'):
-                    best = 'https:' + best
-                elif best.startswith('/'):
-                    best = urljoin(base_url, best)
-                if best.startswith('http'):
-                    highres_urls.append(best)
-
-        # Check high-res data attributes
-        for attr in HIGHRES_ATTRIBUTES:
-            for tag in soup.find_all(attrs={attr: True}):
-                src = tag[attr]
-                if src:
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        src = urljoin(base_url, src)
+        extractor, _ = self._retailer_extractor(base_url)
+        if extractor is not None:
+            urls = extractor(soup)
+            if urls:
+                return list(dict.fromkeys(urls))
+
+        srcset_urls = []
+        attr_urls = {attr: [] for attr in HIGHRES_ATTRIBUTES}
+        og_urls = []
+        twitter_urls = []
+        jsonld_urls = []
+
+        origin = _url_origin(base_url)
+
+        # One walk over the tree, dispatching on each tag, instead of a
+        # separate find_all pass per attribute and tag type
+        for tag in soup.find_all(True):
+            attrs = tag.attrs
+
+            # Check srcset attributes for highest resolution
+            if tag.name == 'img' and 'srcset' in attrs:
+                candidates = _SRCSET_RE.findall(attrs['srcset'])
+                if candidates:
+                    # Pick the largest; ties keep the first listed
+                    best = _absolute_url(max(candidates, key=lambda c: int(c[1] or 0))[0], origin)
+                    if best.startswith('http'):
+                        srcset_urls.append(best)
+
+            # Check high-res data attributes
+            for attr in HIGHRES_ATTRIBUTES:
+                src = attrs.get(attr)
+                if src and isinstance(src, str):
+                    src = _absolute_url(src, origin)
                     if src.startswith('http'):
-                        highres_urls.append(src)
-
-        # Check og:image and twitter:image meta tags
-        for meta in soup.find_all('meta', {'property': 'og:image'}):
-            content = meta.get('content')
-            if content and content.startswith('http'):
-                highres_urls.append(content)
-        for meta in soup.find_all('meta', {'name': 'twitter:image'}):
-            content = meta.get('content')
-            if content and content.startswith('http'):
-                highres_urls.append(content)
-
-        # Check JSON-LD structured data for product images
-        for script in soup.find_all('script', {'type': 'application/ld+json'}):
+                        attr_urls[attr].append(src)
+
+            # Check og:image and twitter:image meta tags
+            if tag.name == 'meta':
+                content = attrs.get('content')
+                if content and content.startswith('http'):
+                    if attrs.get('property') == 'og:image':
+                        og_urls.append(content)
+                    if attrs.get('name') == 'twitter:image':
+                        twitter_urls.append(content)
+
+            # Check JSON-LD structured data for product images
+            elif tag.name == 'script' and attrs.get('type') == 'application/ld+json':
+                try:
+                    # orjson rejects str subclasses such as NavigableString
+                    data = _json_loads(str(tag.string)) if tag.string is not None else None
+                    if isinstance(data, list):
+                        for item in data:
+                            self._extract_jsonld_images(item, jsonld_urls)
+                    elif isinstance(data, dict):
+                        self._extract_jsonld_images(data, jsonld_urls)
+                except (json.JSONDecodeError, TypeError):
+                    continue
+
+        # Same priority order as the separate passes used to produce. The
+        # same image is often listed by srcset, og:image and JSON-LD alike;
+        # an ordered dict drops repeats so callers don't fetch them twice.
+        highres_urls = dict.fromkeys(chain(
+            srcset_urls,
+            *(attr_urls[attr] for attr in HIGHRES_ATTRIBUTES),
+            og_urls,
+            twitter_urls,
+            jsonld_urls,
+        ))
+
+        return list(highres_urls)
+
+    def _retailer_extractor(self, url):
+        """
+        Look up the retailer-specific image extractors for a page URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            (high-res extractor taking a soup, page extractor taking a soup
+            and base URL) tuple; either is None when the retailer has none
+        """
+        # Any label of the host may be the site name (see _retailer_extractors)
+        for label in (urlparse(url).hostname or '').lower().split('.'):
+            extractors = self._retailer_extractors.get(label)
+            if extractors is not None:
+                return extractors
+        return (None, None)
+
+    def _extract_jsonld_product(self, soup):
+        """Extract product image URLs from a page's JSON-LD scripts only."""
+        urls = []
+        for tag in soup.find_all('script', type='application/ld+json'):
             try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    for item in data:
-                        self._extract_jsonld_images(item, highres_urls)
-                elif isinstance(data, dict):
-                    self._extract_jsonld_images(data, highres_urls)
+                # orjson rejects str subclasses such as NavigableString
+                data = _json_loads(str(tag.string)) if tag.string is not None else None
             except (json.JSONDecodeError, TypeError):
                 continue
+            for item in data if isinstance(data, list) else [data]:
+                self._extract_jsonld_images(item, urls)
+        return urls
 
-        return highres_urls
+    def _extract_amazon(self, soup):
+        """Extract the product gallery image URLs from an Amazon page."""
+        old_hires = []
+        a_hires = []
+        renditions = []
+
+        # The landing image and each alternate view carry their full-size URL
+        # in data-old-hires / data-a-hires; data-a-dynamic-image maps every
+        # rendition URL to its [width, height]
+        for img in soup.find_all('img'):
+            attrs = img.attrs
+            src = attrs.get('data-old-hires')
+            if src and src.startswith('http'):
+                old_hires.append(src)
+            src = attrs.get('data-a-hires')
+            if src and src.startswith('http'):
+                a_hires.append(src)
+            if 'data-a-dynamic-image' in attrs:
+                largest = self._largest_amazon_rendition(attrs['data-a-dynamic-image'])
+                if largest:
+                    renditions.append(largest)
+
+        return old_hires + a_hires + renditions
+
+    def _largest_amazon_rendition(self, dynamic_image):
+        """Return the widest URL in a data-a-dynamic-image value, or None."""
+        try:
+            renditions = _json_loads(dynamic_image or '{}')
+        except (json.JSONDecodeError, TypeError):
+            return None
+        if not isinstance(renditions, dict):
+            return None
+        sized = [(u, dims) for u, dims in renditions.items()
+                 if u.startswith('http') and isinstance(dims, list) and dims
+                 and isinstance(dims[0], int)]
+        if not sized:
+            return None
+        return max(sized, key=lambda r: r[1][0])[0]
 
     def _extract_jsonld_images(self, data, results):
         """Extract image URLs from a JSON-LD data object."""
@@ -654,12 +1234,14 @@ class ClothingImageScraper:
                         if url and url.startswith('http'):
                             results.append(url)
 
-    def _check_image_quality(self, filepath):
+    def _check_image_quality(self, filepath, size=None):
         """
         Check if a downloaded image meets minimum quality requirements.
 
         Args:
             filepath: Path to the downloaded image
+            size: (width, height) already parsed from the download, if known;
+                  saves reopening the file
 
         Returns:
             Tuple of (quality_level: str, width: int, height: int)
@@ -671,23 +1253,48 @@ class ClothingImageScraper:
             return 'high_res', 0, 0
 
         try:
-            with PILImage.open(filepath) as img:
-                width, height = img.size
+            if size:
+                width, height = size
+            else:
+                with PILImage.open(filepath) as img:
+                    width, height = img.size
             if width >= MIN_IMAGE_WIDTH and height >= MIN_IMAGE_HEIGHT:
                 self.quality_stats['passed'] += 1
                 return 'high_res', width, height
             elif width >= MIN_LOW_RES_WIDTH and height >= MIN_LOW_RES_HEIGHT:
                 self.quality_stats['failed'] += 1
-                print(f"  Low-res image ({width}x{height} < {MIN_IMAGE_WIDTH}x{MIN_IMAGE_HEIGHT}): {Path(filepath).name}")
+                print(f"  Low-res image ({width}x{height} < {MIN_IMAGE_WIDTH}x{MIN_IMAGE_HEIGHT}): {os.path.basename(filepath)}")
                 return 'low_res', width, height
             else:
                 self.quality_stats['failed'] += 1
-                print(f"  Thumbnail discarded ({width}x{height} < {MIN_LOW_RES_WIDTH}x{MIN_LOW_RES_HEIGHT}): {Path(filepath).name}")
+                print(f"  Thumbnail discarded ({width}x{height} < {MIN_LOW_RES_WIDTH}x{MIN_LOW_RES_HEIGHT}): {os.path.basename(filepath)}")
                 return 'thumbnail', width, height
         except Exception:
             self.quality_stats['passed'] += 1
             return 'high_res', 0, 0
 
+    def _peek_dimensions(self, parser, data):
+        """
+        Feed the next bytes of a download to an incremental image parser.
+
+        PIL reads the size from the JPEG SOF / PNG IHDR / WebP header
+        without decoding pixels. The header can sit behind large EXIF or
+        ICC segments, so the caller feeds chunks until the size is known
+        and then stops.
+
+        Args:
+            parser: PIL ImageFile.Parser for this download
+            data: Next bytes of the image
+
+        Returns:
+            Tuple of (width, height), or None if the header is not parseable yet
+        """
+        try:
+            parser.feed(data)
+        except Exception:
+            return None
+        return parser.image.size if parser.image is not None else None
+
     # ── Existing Utility Methods ─────────────────────────────────────────
 
     def build_search_query(self, brand=None, barcode=None, model=None, color=None, style=None):
@@ -744,9 +1351,8 @@ class ClothingImageScraper:
             filename_parts.append(barcode)
 
         filename = '_'.join(filename_parts)
-        # Clean filename - remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-        filename = filename.replace(' ', '_')
+        # Clean filename - remove invalid characters, spaces to underscores
+        filename = filename.translate(_FILENAME_TRANS)
 
         return f"{filename} - {image_num}.jpg"
 
@@ -769,24 +1375,27 @@ class ClothingImageScraper:
                 print(f"  Failed to access Google Images")
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse(response)
 
-            # Extract image URLs from Google Images
+            # Extract image URLs from Google Images in one walk of the page.
+            # img tags (method 1) rank ahead of data-src divs (method 2), so
+            # stop as soon as there are 10 img URLs.
             image_urls = []
+            div_urls = []
+            for tag in soup.descendants:
+                name = getattr(tag, 'name', None)  # None for text nodes
+                if name == 'img':
+                    src = tag.get('src') or tag.get('data-src')
+                    if src and src.startswith('http'):
+                        image_urls.append(src)
+                        if len(image_urls) >= 10:
+                            break
+                elif name == 'div':
+                    data_src = tag.get('data-src')
+                    if data_src and data_src.startswith('http'):
+                        div_urls.append(data_src)
 
-            # Method 1: Look for img tags
-            for img in soup.find_all('img'):
-                src = img.get('src') or img.get('data-src')
-                if src and src.startswith('http'):
-                    image_urls.append(src)
-
-            # Method 2: Look for data-src in divs
-            for div in soup.find_all('div'):
-                data_src = div.get('data-src')
-                if data_src and data_src.startswith('http'):
-                    image_urls.append(data_src)
-
-            return image_urls[:10]  # Return first 10 URLs
+            return (image_urls + div_urls)[:10]  # Return first 10 URLs
 
         except Exception as e:
             print(f"Error searching Google Images: {e}")
@@ -813,7 +1422,7 @@ class ClothingImageScraper:
                 print(f"  Failed to access Google Shopping")
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse(response)
             image_urls = []
 
             # Extract product images from Google Shopping
@@ -855,31 +1464,7 @@ class ClothingImageScraper:
         Returns:
             List of search query strings
         """
-        queries = []
-
-        # Rule 1: Brand + Model + Color
-        if brand and model and color:
-            queries.append(f"{brand} {model} {color}")
-        elif brand and model:
-            queries.append(f"{brand} {model}")
-
-        # Rule 2: Brand + UPC/Barcode
-        if brand and barcode:
-            queries.append(f"{brand} {barcode}")
-        elif barcode:
-            queries.append(barcode)
-
-        # Rule 3: Brand + Style + Color
-        if brand and style and color:
-            queries.append(f"{brand} {style} {color}")
-        elif brand and style:
-            queries.append(f"{brand} {style}")
-
-        # Fallback: Just brand if nothing else
-        if not queries and brand:
-            queries.append(brand)
-
-        return queries
+        return list(_build_search_queries(brand, barcode, model, color, style))
 
     def search_specific_retailers(self, query):
         """
@@ -892,62 +1477,7 @@ class ClothingImageScraper:
         Returns:
             List of (retailer_name, search_url) tuples
         """
-        urls = []
-        encoded_query = quote_plus(query)
-
-        # Most Accessible Shoe Retailers (usually work)
-        urls.append(('Zappos', f"https://www.zappos.com/search?term={encoded_query}"))
-        urls.append(('DSW', f"https://www.dsw.com/en/us/search?q={encoded_query}"))
-        urls.append(('Amazon', f"https://www.amazon.com/s?k={encoded_query}"))
-        urls.append(('eBay', f"https://www.ebay.com/sch/i.html?_nkw={encoded_query}"))
-
-        # Department Stores & Fashion Retailers
-        urls.append(('Belk', f"https://www.belk.com/search/?q={encoded_query}"))
-        urls.append(('Forever 21', f"https://www.forever21.com/us/search?q={encoded_query}"))
-        urls.append(('Lord & Taylor', f"https://www.lordandtaylor.com/search?q={encoded_query}"))
-
-        # Luxury Fashion Aggregators & Marketplaces
-        urls.append(('ModeSens', f"https://modesens.com/search/?q={encoded_query}"))
-        urls.append(('Clothbase', f"https://clothbase.com/search?q={encoded_query}"))
-        urls.append(('Editorialist', f"https://editorialist.com/search?q={encoded_query}"))
-        urls.append(('Brands Gateway', f"https://brandsgateway.com/search?q={encoded_query}"))
-        urls.append(('Hello Luxy', f"https://www.helloluxy.com/search?q={encoded_query}"))
-        urls.append(('Banter', f"https://www.banter.com/search?q={encoded_query}"))
-
-        # Additional Luxury/Fashion Shoe Sites
-        urls.append(('Level Shoes', f"https://us.levelshoes.com/search?q={encoded_query}"))
-        urls.append(('Beyond Style', f"https://www.beyondstyle.us/search?q={encoded_query}"))
-        urls.append(('YOOX', f"https://www.yoox.com/us/search?q={encoded_query}"))
-        urls.append(('The BS', f"https://www.thebs.com/search?q={encoded_query}"))
-        urls.append(('Fetching', f"https://fetching.co.kr/search?q={encoded_query}"))
-
-        # Brand Direct Sites (when brand is detected)
-        query_lower = query.lower()
-        if 'nike' in query_lower:
-            urls.append(('Nike', f"https://www.nike.com/w?q={encoded_query}"))
-        if 'adidas' in query_lower:
-            urls.append(('Adidas', f"https://www.adidas.com/us/search?q={encoded_query}"))
-        if 'puma' in query_lower:
-            urls.append(('Puma', f"https://us.puma.com/us/en/search?q={encoded_query}"))
-        if 'new balance' in query_lower:
-            urls.append(('New Balance', f"https://www.newbalance.com/search/?q={encoded_query}"))
-        if 'converse' in query_lower:
-            urls.append(('Converse', f"https://www.converse.com/shop?q={encoded_query}"))
-        if 'vans' in query_lower:
-            urls.append(('Vans', f"https://www.vans.com/shop/search?q={encoded_query}"))
-        if 'stuart weitzman' in query_lower:
-            urls.append(('Stuart Weitzman', f"https://www.stuartweitzman.com/search/?q={encoded_query}"))
-        if 'sam edelman' in query_lower:
-            urls.append(('Sam Edelman', f"https://www.samedelman.com/search?q={encoded_query}"))
-        if 'steve madden' in query_lower:
-            urls.append(('Steve Madden', f"https://www.stevemadden.com/search?q={encoded_query}"))
-
-        # General Accessible Retailers
-        urls.append(('Walmart', f"https://www.walmart.com/search?q={encoded_query}"))
-        urls.append(('Target', f"https://www.target.com/s?searchTerm={encoded_query}"))
-        urls.append(('6pm', f"https://www.6pm.com/search?term={encoded_query}"))
-
-        return urls
+        return list(_retailer_search_urls(query))
 
     def extract_images_from_page(self, url, retailer_name='generic'):
         """
@@ -969,7 +1499,7 @@ class ClothingImageScraper:
                 print(f"    Failed to access page: {url}")
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse(response)
 
             # Check for CAPTCHA before extracting images
             is_captcha, captcha_type = self._detect_captcha_in_soup(soup)
@@ -983,39 +1513,23 @@ class ClothingImageScraper:
             highres = self._extract_highres_from_soup(soup, url)
             image_urls.extend(highres)
 
-            # Retailer-specific extraction methods
-            if 'tjmaxx' in url.lower() or 'marshalls' in url.lower():
-                image_urls.extend(self._extract_tjx_images(soup, url))
-            elif 'nordstrom' in url.lower():
-                image_urls.extend(self._extract_nordstrom_images(soup, url))
-            elif 'macys' in url.lower():
-                image_urls.extend(self._extract_macys_images(soup, url))
-            elif 'zappos' in url.lower():
-                image_urls.extend(self._extract_zappos_images(soup, url))
-            elif 'amazon' in url.lower():
-                image_urls.extend(self._extract_amazon_images(soup, url))
-            elif 'nike' in url.lower():
-                image_urls.extend(self._extract_nike_images(soup, url))
-            else:
-                # Generic extraction
-                image_urls.extend(self._extract_generic_images(soup, url))
-
-            # Try upgrading all URLs to higher quality
-            upgraded_urls = []
-            for img_url in image_urls:
+            # Retailer-specific extraction methods, chosen by the site name in
+            # the host
+            _, extractor = self._retailer_extractor(url)
+            if extractor is None:
+                extractor = self._extract_generic_images  # Generic extraction
+            image_urls.extend(extractor(soup, url))
+
+            # Upgrade each URL to higher quality and drop duplicates in one
+            # pass, preserving order (prefer upgraded/highres first). Verbatim
+            # repeats are dropped by dict.fromkeys before the upgrade; the
+            # signature-keyed dict keeps the first URL for each signature.
+            unique_images = {}
+            for img_url in dict.fromkeys(image_urls):
                 upgraded = self._upgrade_image_url(img_url)
-                upgraded_urls.append(upgraded)
-
-            # Remove duplicates while preserving order (prefer upgraded/highres first)
-            seen = set()
-            unique_images = []
-            for img_url in upgraded_urls:
-                sig = self._create_image_signature(img_url)
-                if sig not in seen:
-                    seen.add(sig)
-                    unique_images.append(img_url)
+                unique_images.setdefault(self._create_image_signature(upgraded), upgraded)
 
-            return unique_images
+            return list(unique_images.values())
 
         except Exception as e:
             print(f"Error extracting images from {url}: {e}")
@@ -1024,28 +1538,28 @@ class ClothingImageScraper:
     def _extract_tjx_images(self, soup, base_url):
         """Extract images from TJX sites (TJ Maxx, Marshalls)"""
         images = []
+        fallback = []
+        origin = _url_origin(base_url)
 
-        # Product images
-        for img in soup.find_all('img', {'class': re.compile(r'product.*image|slide.*image', re.I)}):
-            src = img.get('src') or img.get('data-src')
-            if src:
-                if src.startswith('//'):
-                    src = 'https:' + src
-                elif src.startswith('/'):
-                    src = urljoin(base_url, src)
-                src = src.replace('_small', '_large').replace('_thumb', '_large')
-                images.append(src)
+        for img in soup.find_all('img'):
+            attrs = img.attrs
+            classes = attrs.get('class') or ()
 
-        # Fallback: any product image
-        if not images:
-            for img in soup.find_all('img'):
-                img_class = ' '.join(img.get('class', []))
-                if 'product' in img_class.lower():
-                    src = img.get('src') or img.get('data-src')
-                    if src and src.startswith('http'):
-                        images.append(src)
+            # Product images
+            if _class_search(_TJX_IMAGE_RE, classes):
+                src = attrs.get('src') or attrs.get('data-src')
+                if src:
+                    src = _absolute_url(src, origin)
+                    src = src.replace('_small', '_large').replace('_thumb', '_large')
+                    images.append(src)
 
-        return images
+            # Fallback: any product image
+            if any('product' in c.lower() for c in classes):
+                src = attrs.get('src') or attrs.get('data-src')
+                if src and src.startswith('http'):
+                    fallback.append(src)
+
+        return images or fallback
 
     def _extract_nordstrom_images(self, soup, base_url):
         """Extract images from Nordstrom"""
@@ -1072,7 +1586,7 @@ class ClothingImageScraper:
         images = []
 
         # Macy's uses specific image classes
-        for img in soup.find_all('img', {'class': re.compile(r'productImage|mainImage', re.I)}):
+        for img in soup.find_all('img', {'class': _MACYS_IMAGE_RE}):
             src = img.get('src') or img.get('data-src')
             if src:
                 # Upgrade to larger size
@@ -1099,23 +1613,25 @@ class ClothingImageScraper:
 
     def _extract_amazon_images(self, soup, base_url):
         """Extract images from Amazon"""
-        images = []
-
-        # Amazon product images
-        for img in soup.find_all('img', {'data-old-hires': True}):
-            images.append(img['data-old-hires'])
-
-        for img in soup.find_all('img', {'data-a-hires': True}):
-            images.append(img['data-a-hires'])
-
-        # Fallback to regular images
-        if not images:
-            for img in soup.find_all('img', {'class': re.compile(r'product|main', re.I)}):
-                src = img.get('src')
+        old_hires = []
+        a_hires = []
+        fallback = []
+
+        # One pass over the images, bucketed so the result keeps the
+        # data-old-hires, data-a-hires, fallback priority order
+        for img in soup.find_all('img'):
+            attrs = img.attrs
+            if 'data-old-hires' in attrs:
+                old_hires.append(attrs['data-old-hires'])
+            if 'data-a-hires' in attrs:
+                a_hires.append(attrs['data-a-hires'])
+            if _class_search(_AMAZON_IMAGE_RE, attrs.get('class')):
+                src = attrs.get('src')
                 if src and 'images-amazon' in src:
-                    images.append(src)
+                    fallback.append(src)
 
-        return images
+        # Fall back to regular images only when no hi-res ones were found
+        return (old_hires + a_hires) or fallback
 
     def _extract_nike_images(self, soup, base_url):
         """Extract images from Nike"""
@@ -1133,46 +1649,56 @@ class ClothingImageScraper:
 
     def _extract_generic_images(self, soup, base_url):
         """Generic image extraction for any website"""
-        images = []
-
-        # Common product image patterns
-        patterns = [
-            {'itemprop': 'image'},
-            {'class': re.compile(r'product.*image', re.I)},
-            {'class': re.compile(r'gallery.*image', re.I)},
-            {'class': re.compile(r'zoom.*image', re.I)},
-            {'id': re.compile(r'product.*image', re.I)},
-        ]
-
-        for pattern in patterns:
-            for img in soup.find_all('img', pattern):
-                src = img.get('src') or img.get('data-src') or img.get('data-zoom-image')
+        # Common product image patterns, in priority order: itemprop=image,
+        # product/gallery/zoom image classes, product image id
+        matched = ([], [], [], [], [])
+        matched_any = False
+        fallback = []
+        origin = _url_origin(base_url)
+
+        # One pass over the images instead of a find_all per pattern plus
+        # another for the fallback; buckets keep the per-pattern order
+        for img in soup.find_all('img'):
+            attrs = img.attrs
+            classes = attrs.get('class')
+            img_id = attrs.get('id')
+            hits = (
+                attrs.get('itemprop') == 'image',
+                _class_search(_PRODUCT_IMAGE_RE, classes),
+                _class_search(_GALLERY_IMAGE_RE, classes),
+                _class_search(_ZOOM_IMAGE_RE, classes),
+                isinstance(img_id, str) and _PRODUCT_IMAGE_RE.search(img_id) is not None,
+            )
+            if any(hits):
+                src = attrs.get('src') or attrs.get('data-src') or attrs.get('data-zoom-image')
                 if src:
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        src = urljoin(base_url, src)
+                    src = _absolute_url(src, origin)
                     if src.startswith('http'):
-                        images.append(src)
-
-        # If still no images, look for any reasonably sized images
-        if not images:
-            for img in soup.find_all('img'):
-                src = img.get('src')
-                if src and src.startswith('http'):
-                    # Filter out tiny images (icons, etc.)
-                    width = img.get('width')
-                    height = img.get('height')
-                    if width and height:
-                        try:
-                            if int(width) > 200 and int(height) > 200:
-                                images.append(src)
-                        except Exception:
-                            images.append(src)
-                    else:
-                        images.append(src)
+                        matched_any = True
+                        for bucket, hit in zip(matched, hits):
+                            if hit:
+                                bucket.append(src)
+
+            # Any reasonably sized image, used only if no pattern matched,
+            # so stop collecting them once one has
+            if matched_any:
+                continue
+            src = attrs.get('src')
+            if src and src.startswith('http'):
+                # Filter out tiny images (icons, etc.)
+                width = attrs.get('width')
+                height = attrs.get('height')
+                if width and height:
+                    try:
+                        if int(width) > 200 and int(height) > 200:
+                            fallback.append(src)
+                    except Exception:
+                        fallback.append(src)
+                else:
+                    fallback.append(src)
 
-        return images
+        images = list(chain.from_iterable(matched))
+        return images or fallback
 
     def search_retailers_for_product(self, query):
         """
@@ -1190,80 +1716,99 @@ class ClothingImageScraper:
 
         successful_searches = 0
 
-        # Try Reversible.com with enhanced method first (has heavy bot protection)
-        print(f"  Attempting Reversible.com with enhanced method...")
-        reversible_results = self._try_reversible_search(query)
-        if reversible_results:
-            product_pages.extend(reversible_results)
-            successful_searches += len(reversible_results)
-            print(f"  Found {len(reversible_results)} products on Reversible")
-        else:
-            print(f"  Reversible blocked or no results (expected - has bot protection)")
+        # Skip Reversible since it is tried specially below
+        candidates = [(name, url) for name, url in retailer_urls
+                      if 'reversible' not in name.lower()]
+
+        def search(candidate):
+            return self._search_retailer(*candidate)
+
+        # Every retailer is a different host, so search them in parallel waves
+        # and keep the first hits in retailer priority order
+        with ThreadPoolExecutor(max_workers=RETAILER_SEARCH_WORKERS + 1) as pool:
+            # Try Reversible.com with enhanced method first (has heavy bot
+            # protection). It returns at most 3 products, so the first wave
+            # always runs and can overlap its cookie priming and pause.
+            print(f"  Attempting Reversible.com with enhanced method...")
+            reversible_future = pool.submit(self._try_reversible_search, query)
+            first_wave = list(pool.map(search, candidates[:RETAILER_SEARCH_WORKERS]))
+
+            reversible_results = reversible_future.result()
+            if reversible_results:
+                product_pages.extend(reversible_results)
+                successful_searches += len(reversible_results)
+                print(f"  Found {len(reversible_results)} products on Reversible")
+            else:
+                print(f"  Reversible blocked or no results (expected - has bot protection)")
 
-        for retailer_name, search_url in retailer_urls:
-            try:
+            for start in range(0, len(candidates), RETAILER_SEARCH_WORKERS):
                 # Skip if we already found enough
                 if successful_searches >= 5:
                     break
+                if start == 0:
+                    wave_results = first_wave
+                else:
+                    wave_results = pool.map(search, candidates[start:start + RETAILER_SEARCH_WORKERS])
+                for found in wave_results:
+                    if found and successful_searches < 5:
+                        product_pages.append(found)
+                        successful_searches += 1
 
-                # Skip Reversible since we tried it specially above
-                if 'reversible' in retailer_name.lower():
-                    continue
-
-                print(f"  Searching {retailer_name}...")
-
-                # Use enhanced request method with anti-detection
-                response = self._make_request(search_url, timeout=METHOD_TIMEOUT, retries=2)
-
-                if response is None:
-                    print(f"  {retailer_name} timed out or failed (skipping)")
-                    continue
-
-                # Check for blocking
-                if response.status_code == 403:
-                    print(f"  {retailer_name} blocked automated access (skipping)")
-                    continue
-
-                if response.status_code == 404:
-                    continue  # Silently skip 404s
-
-                soup = BeautifulSoup(response.text, 'html.parser')
+        return product_pages
 
-                # Find product links (common patterns)
-                found_product = False
-                for a in soup.find_all('a', href=True):
-                    href = a['href']
+    def _search_retailer(self, retailer_name, search_url):
+        """
+        Search one retailer and pick the first product link from the results.
 
-                    # Common product URL patterns
-                    if any(keyword in href.lower() for keyword in ['/product/', '/p/', '/item/', '/dp/', '/pd/']):
-                        # Make URL absolute
-                        if href.startswith('/'):
-                            href = urljoin(search_url, href)
+        Args:
+            retailer_name: Display name of the retailer
+            search_url: Retailer search URL for the query
 
-                        if href.startswith('http'):
-                            product_pages.append((retailer_name, href))
-                            found_product = True
-                            successful_searches += 1
-                            print(f"  Found product on {retailer_name}")
-                            break  # Just get first product from each retailer
+        Returns:
+            (retailer_name, product_url) tuple, or None if nothing was found
+        """
+        try:
+            print(f"  Searching {retailer_name}...")
 
-                if not found_product:
-                    print(f"  - No products found on {retailer_name}")
+            # Use enhanced request method with anti-detection
+            response = self._make_request(search_url, timeout=METHOD_TIMEOUT, retries=2)
 
-                time.sleep(0.5)  # Be polite
+            if response is None:
+                print(f"  {retailer_name} timed out or failed (skipping)")
+                return None
 
-            except requests.exceptions.HTTPError as e:
-                if '403' in str(e):
-                    print(f"  {retailer_name} blocked automated access (skipping)")
-                continue
-            except requests.exceptions.Timeout:
-                print(f"  {retailer_name} timed out (skipping)")
-                continue
-            except Exception:
-                # Silently skip other errors to keep output clean
-                continue
+            # Check for blocking
+            if response.status_code == 403:
+                print(f"  {retailer_name} blocked automated access (skipping)")
+                return None
 
-        return product_pages
+            if response.status_code == 404:
+                return None  # Silently skip 404s
+
+            # Find product links (common patterns)
+            for href in self._matching_hrefs(response, _PRODUCT_LINK_XPATH,
+                                             _PRODUCT_LINK_KEYWORDS, ignore_case=True):
+                # Make URL absolute
+                if href.startswith('/'):
+                    href = urljoin(search_url, href)
+
+                if href.startswith('http'):
+                    print(f"  Found product on {retailer_name}")
+                    return (retailer_name, href)  # Just get first product from each retailer
+
+            print(f"  - No products found on {retailer_name}")
+            return None
+
+        except requests.exceptions.HTTPError as e:
+            if '403' in str(e):
+                print(f"  {retailer_name} blocked automated access (skipping)")
+            return None
+        except requests.exceptions.Timeout:
+            print(f"  {retailer_name} timed out (skipping)")
+            return None
+        except Exception:
+            # Silently skip other errors to keep output clean
+            return None
 
     def _try_reversible_search(self, query):
         """
@@ -1283,7 +1828,7 @@ class ClothingImageScraper:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept-Encoding': ACCEPT_ENCODING,
                 'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1',
                 'Sec-Fetch-Dest': 'document',
@@ -1297,39 +1842,34 @@ class ClothingImageScraper:
                 'Referer': 'https://www.google.com/'
             }
 
-            # Create a new session just for Reversible
-            reversible_session = requests.Session()
-            reversible_session.headers.update(enhanced_headers)
+            # Reuse the pooled session, overriding its headers per request, so
+            # the TLS connection is shared and its jar carries the cookies
 
             # First, visit the homepage to get cookies
             homepage_url = 'https://www.reversible.com'
-            reversible_session.get(homepage_url, timeout=10)
+            self.session.get(homepage_url, headers=enhanced_headers, timeout=10)
             time.sleep(2)  # Wait like a human would
 
             # Now try the search
             search_url = f"https://www.reversible.com/search?q={quote_plus(query)}"
-            response = reversible_session.get(search_url, timeout=15, allow_redirects=True)
+            response = self.session.get(search_url, headers=enhanced_headers,
+                                        timeout=15, allow_redirects=True)
 
             if response.status_code == 403:
                 return []  # Still blocked, return empty
 
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
             # Look for product links on Reversible
-            for a in soup.find_all('a', href=True):
-                href = a['href']
-
-                # Reversible product URL patterns
-                if '/products/' in href or '/items/' in href:
-                    if href.startswith('/'):
-                        href = urljoin(homepage_url, href)
-
-                    if href.startswith('http'):
-                        results.append(('Reversible', href))
-                        if len(results) >= 3:  # Get up to 3 products
-                            break
+            for href in self._matching_hrefs(response, _REVERSIBLE_LINK_XPATH,
+                                             _REVERSIBLE_LINK_KEYWORDS):
+                if href.startswith('/'):
+                    href = urljoin(homepage_url, href)
+
+                if href.startswith('http'):
+                    results.append(('Reversible', href))
+                    if len(results) >= 3:  # Get up to 3 products
+                        break
 
             return results
 
@@ -1345,7 +1885,7 @@ class ClothingImageScraper:
         on product pages found during earlier scraping stages.
         """
         method_name = 'structured_data'
-        start = time.time()
+        start = time.perf_counter()
         found = 0
 
         # Look at product pages we already know about from retailer search
@@ -1356,7 +1896,7 @@ class ClothingImageScraper:
                     response = self._make_request(search_url, timeout=METHOD_TIMEOUT, retries=1)
                     if response is None:
                         continue
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = self._parse(response)
 
                     # Extract product page links from search results
                     for a in soup.find_all('a', href=True):
@@ -1376,18 +1916,10 @@ class ClothingImageScraper:
                             continue
 
                         # Try to get structured data from this page
-                        page_resp = self._make_request(actual_url, timeout=METHOD_TIMEOUT, retries=1)
-                        if page_resp is None:
-                            continue
-                        page_soup = BeautifulSoup(page_resp.text, 'html.parser')
-
-                        highres = self._extract_highres_from_soup(page_soup, actual_url)
+                        highres = self._get_page_highres(actual_url)
                         for img_url in highres:
-                            sig = self._create_image_signature(img_url)
-                            if sig not in seen_signatures:
-                                image_urls.append(img_url)
-                                seen_signatures.add(sig)
-                                search_metadata['sources'].append(('Structured Data', actual_url))
+                            if self._add_candidate(img_url, ('Structured Data', actual_url),
+                                                   image_urls, seen_signatures, search_metadata):
                                 found += 1
 
                         if found > 0:
@@ -1402,18 +1934,85 @@ class ClothingImageScraper:
             if found > 0:
                 break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         self._log_method_stat(method_name, found > 0, elapsed)
         if found > 0:
             print(f"  Found {found} images via structured data extraction")
         return found
 
+    def _get_page_highres(self, url):
+        """
+        Fetch a product page and extract its high-res image URLs, caching the
+        result so a page linked from several search results is fetched and
+        parsed only once.
+
+        Args:
+            url: Product page URL
+
+        Returns:
+            List of high-resolution image URLs (empty if the page failed)
+        """
+        with self._page_highres_lock:
+            highres = self._page_highres.get(url)
+            if highres is not None:
+                self._page_highres.move_to_end(url)
+                return highres
+
+        page_resp = self._make_request(url, timeout=METHOD_TIMEOUT, retries=1)
+        if page_resp is None:
+            highres = []
+        else:
+            # Product pages that list their gallery in JSON-LD are read with a
+            # regex over the raw bytes, without building the whole tree
+            highres = (self._scan_structured_images(page_resp.content)
+                       or self._extract_highres_from_soup(self._parse(page_resp), url))
+
+        with self._page_highres_lock:
+            self._page_highres[url] = highres
+            if len(self._page_highres) > PAGE_CACHE_SIZE:
+                self._page_highres.popitem(last=False)
+        return highres
+
+    def _scan_structured_images(self, content):
+        """
+        Pull og:image and JSON-LD image URLs out of raw page bytes.
+
+        Only pages whose JSON-LD lists several product images count; a lone
+        og:image would hide the srcset, data attribute and twitter:image
+        candidates that _extract_highres_from_soup finds.
+
+        Args:
+            content: Response body bytes
+
+        Returns:
+            List of image URLs, og:image first (empty if JSON-LD listed
+            fewer than two images)
+        """
+        jsonld_urls = []
+        for m in _JSONLD_BYTES_RE.finditer(content):
+            try:
+                data = _json_loads(m.group(1))
+            except (ValueError, TypeError):
+                continue
+            for item in data if isinstance(data, list) else [data]:
+                self._extract_jsonld_images(item, jsonld_urls)
+        if len(set(jsonld_urls)) < 2:
+            return []
+
+        og_urls = []
+        for m in _OG_IMAGE_BYTES_RE.finditer(content):
+            url = html.unescape(m.group(1).decode('utf-8', 'replace'))
+            if url.startswith('http'):
+                og_urls.append(url)
+
+        return list(dict.fromkeys(og_urls + jsonld_urls))
+
     def _try_site_specific_search(self, queries, image_urls, seen_signatures, search_metadata):
         """
         Method 4: Alternative Sources - try Google with site-specific searches.
         """
         method_name = 'site_specific_search'
-        start = time.time()
+        start = time.perf_counter()
         found = 0
 
         for query in queries[:2]:  # Use first 2 queries
@@ -1426,15 +2025,12 @@ class ClothingImageScraper:
                     if response is None:
                         continue
 
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = self._parse(response)
                     for img in soup.find_all('img'):
                         src = img.get('src') or img.get('data-src')
                         if src and src.startswith('http'):
-                            sig = self._create_image_signature(src)
-                            if sig not in seen_signatures:
-                                image_urls.append(src)
-                                seen_signatures.add(sig)
-                                search_metadata['sources'].append(('Site-Specific Search', site_filter))
+                            if self._add_candidate(src, ('Site-Specific Search', site_filter),
+                                                   image_urls, seen_signatures, search_metadata):
                                 found += 1
 
                     time.sleep(0.5)
@@ -1446,7 +2042,7 @@ class ClothingImageScraper:
             if found >= 3:
                 break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         self._log_method_stat(method_name, found > 0, elapsed)
         if found > 0:
             print(f"  Found {found} images via site-specific searches")
@@ -1457,7 +2053,7 @@ class ClothingImageScraper:
         Method 5: Mobile/AMP Endpoints - try mobile and AMP versions of found URLs.
         """
         method_name = 'mobile_amp'
-        start = time.time()
+        start = time.perf_counter()
         found = 0
 
         # Collect unique source page URLs we've seen
@@ -1466,49 +2062,46 @@ class ClothingImageScraper:
             if source_url and source_url.startswith('http') and 'google' not in source_url:
                 source_urls.add(source_url)
 
+        # Mobile and AMP variants of each source page, in the order they're tried
+        variants = []
         for source_url in list(source_urls)[:3]:  # Limit attempts
             parsed = urlparse(source_url)
             domain = parsed.netloc
 
-            # Try mobile version
-            mobile_domain = 'm.' + domain.lstrip('www.')
-            mobile_url = f"{parsed.scheme}://{mobile_domain}{parsed.path}"
-            if parsed.query:
-                mobile_url += f"?{parsed.query}"
+            # Try mobile version, unless the source already is one
+            if not domain.startswith('m.'):
+                bare_domain = domain[4:] if domain.startswith('www.') else domain
+                mobile_url = f"{parsed.scheme}://m.{bare_domain}{parsed.path}"
+                if parsed.query:
+                    mobile_url += f"?{parsed.query}"
+                variants.append(('Mobile Endpoint', mobile_url))
 
-            try:
-                response = self._make_request(mobile_url, timeout=METHOD_TIMEOUT, retries=1)
-                if response and response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    page_images = self._extract_generic_images(soup, mobile_url)
-                    for img_url in page_images[:2]:
-                        sig = self._create_image_signature(img_url)
-                        if sig not in seen_signatures:
-                            image_urls.append(img_url)
-                            seen_signatures.add(sig)
-                            search_metadata['sources'].append(('Mobile Endpoint', mobile_url))
-                            found += 1
-            except Exception:
-                pass
+            # Try AMP version, unless the source already is one
+            if not parsed.path.rstrip('/').endswith('/amp'):
+                variants.append(('AMP Endpoint', source_url.rstrip('/') + '/amp'))
 
-            # Try AMP version
-            amp_url = source_url.rstrip('/') + '/amp'
+        def fetch_images(variant_url):
             try:
-                response = self._make_request(amp_url, timeout=METHOD_TIMEOUT, retries=1)
+                response = self._make_request(variant_url, timeout=METHOD_TIMEOUT, retries=1)
                 if response and response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    page_images = self._extract_generic_images(soup, amp_url)
-                    for img_url in page_images[:2]:
-                        sig = self._create_image_signature(img_url)
-                        if sig not in seen_signatures:
-                            image_urls.append(img_url)
-                            seen_signatures.add(sig)
-                            search_metadata['sources'].append(('AMP Endpoint', amp_url))
-                            found += 1
+                    soup = self._parse(response)
+                    return self._extract_generic_images(soup, variant_url)
             except Exception:
                 pass
+            return []
 
-        elapsed = time.time() - start
+        # The variants are independent pages, mostly on different hosts, so
+        # fetch them in parallel and merge the results in the original order
+        if variants:
+            with ThreadPoolExecutor(max_workers=RETAILER_SEARCH_WORKERS) as pool:
+                pages = list(pool.map(fetch_images, [url for _, url in variants]))
+            for (label, variant_url), page_images in zip(variants, pages):
+                for img_url in page_images[:2]:
+                    if self._add_candidate(img_url, (label, variant_url),
+                                           image_urls, seen_signatures, search_metadata):
+                        found += 1
+
+        elapsed = time.perf_counter() - start
         self._log_method_stat(method_name, found > 0, elapsed)
         if found > 0:
             print(f"  Found {found} images via mobile/AMP endpoints")
@@ -1520,37 +2113,109 @@ class ClothingImageScraper:
         suffixes, modifying dimension params to get higher quality versions.
         """
         method_name = 'url_manipulation'
-        start = time.time()
+        start = time.perf_counter()
         found = 0
 
-        current_urls = list(image_urls)  # Snapshot
-        for img_url in current_urls[:10]:
+        candidates = []
+        for img_url in image_urls[:10]:
             upgraded = self._upgrade_image_url(img_url)
             if upgraded != img_url:
                 sig = self._create_image_signature(upgraded)
                 if sig not in seen_signatures:
-                    # Verify the upgraded URL is accessible
-                    try:
-                        head_resp = self.session.head(upgraded, timeout=5, allow_redirects=True)
-                        if head_resp.status_code == 200:
-                            content_type = head_resp.headers.get('Content-Type', '')
-                            if 'image' in content_type:
-                                image_urls.append(upgraded)
-                                seen_signatures.add(sig)
-                                search_metadata['sources'].append(('URL Manipulation', img_url))
-                                found += 1
-                    except Exception:
-                        pass
+                    candidates.append((img_url, upgraded, sig))
 
-        elapsed = time.time() - start
+        def is_image(url):
+            # Verify the upgraded URL is accessible
+            try:
+                with self._host_slot(url):
+                    head_resp = self.session.head(url, timeout=5, allow_redirects=True)
+                return (head_resp.status_code == 200
+                        and 'image' in head_resp.headers.get('Content-Type', ''))
+            except Exception:
+                return False
+
+        # Send the HEAD checks in parallel (still capped per host), then
+        # accept the upgrades in their original order
+        if candidates:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+                accessible = list(pool.map(is_image, [upgraded for _, upgraded, _ in candidates]))
+            for (img_url, upgraded, sig), ok in zip(candidates, accessible):
+                if ok and self._add_candidate(upgraded, ('URL Manipulation', img_url),
+                                              image_urls, seen_signatures, search_metadata):
+                    found += 1
+
+        elapsed = time.perf_counter() - start
         self._log_method_stat(method_name, found > 0, elapsed)
         if found > 0:
             print(f"  Found {found} upgraded image URLs via URL manipulation")
         return found
 
+    def _try_mobile_google_images(self, queries, max_images, image_urls, seen_sigs, search_metadata):
+        """
+        Method 8: Google Images fetched over plain HTTP with a mobile user
+        agent, which gets a page whose result links carry the original image
+        URL (imgurl=) without running any JS. Further result pages are
+        requested with ijn= (the page index) while they keep adding images.
+
+        Args:
+            queries: Search query strings
+            max_images: Stop once image_urls holds this many
+            image_urls: List to append found image URLs to
+            seen_sigs: Set of already-seen image signatures
+            search_metadata: Metadata dict to update with sources
+        Returns:
+            Tuple of (number of new images found, True if Google served a CAPTCHA)
+        """
+        method_name = 'mobile_google_images'
+        start = time.perf_counter()
+        found = 0
+        blocked = False
+
+        for query in queries[:2]:  # Same queries the browser would try
+            for page in range(MOBILE_GOOGLE_PAGES):
+                search_url = (f"https://www.google.com/search?q={quote_plus(query)}"
+                              f"&tbm=isch&ijn={page}")
+                headers = self.session.headers.copy()
+                headers['User-Agent'] = MOBILE_USER_AGENT
+                headers['Referer'] = 'https://www.google.com/'
+                try:
+                    with self._host_slot(search_url):
+                        response = self.session.get(search_url, headers=headers,
+                                                    timeout=METHOD_TIMEOUT)
+                except requests.exceptions.RequestException:
+                    break
+                if response.status_code != 200:
+                    break
+                is_captcha, captcha_type = self._detect_captcha(response)
+                if is_captcha:
+                    self._log_captcha(search_url, captcha_type)
+                    blocked = True
+                    break
+
+                page_found = 0
+                soup = self._parse(response)
+                for a in soup.find_all('a', href=True):
+                    img_url = parse_qs(urlparse(a['href']).query).get('imgurl', [''])[0]
+                    if not img_url.startswith('http') or _SKIPPED_IMAGE_EXT_RE.search(img_url):
+                        continue
+                    if self._add_candidate(img_url, ('Mobile Google Images', search_url),
+                                           image_urls, seen_sigs, search_metadata):
+                        page_found += 1
+                found += page_found
+                if not page_found or len(image_urls) >= max_images:
+                    break  # Past the end of the results, or enough already
+            if blocked or len(image_urls) >= max_images:
+                break  # Blocked (the browser takes over), or enough found
+
+        elapsed = time.perf_counter() - start
+        self._log_method_stat(method_name, found > 0, elapsed)
+        if found > 0:
+            print(f"  Found {found} images via mobile Google Images")
+        return found, blocked
+
     def _try_browser_scraping(self, queries, image_urls, seen_sigs, search_metadata):
         """
-        Method 8: Headless browser automation using Playwright.
+        Method 9: Headless browser automation using Playwright.
         Handles JS-rendered content, lazy-loaded images, and infinite scroll.
 
         Args:
@@ -1562,140 +2227,205 @@ class ClothingImageScraper:
             Number of new images found
         """
         method_name = 'browser_automation'
-        start = time.time()
+        start = time.perf_counter()
         found = 0
 
         if not PLAYWRIGHT_AVAILABLE:
             print("  Playwright not installed, skipping browser automation")
-            self._log_method_stat(method_name, False, time.time() - start)
+            self._log_method_stat(method_name, False, time.perf_counter() - start)
             return 0
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=BROWSER_HEADLESS)
-                context = browser.new_context(
-                    user_agent=self.user_agents[0],
-                    viewport={'width': 1920, 'height': 1080},
-                )
-                page = context.new_page()
-                page.set_default_timeout(BROWSER_TIMEOUT)
-
-                for query in queries[:2]:  # Limit to first 2 queries
+            # Playwright objects only work on the thread that created them, so
+            # all browser work runs on the scraper's dedicated browser thread
+            found = self._browser_thread().submit(
+                self._browse_for_images, queries, image_urls, seen_sigs, search_metadata).result()
+        except Exception as e:
+            print(f"  Browser automation error: {e}")
+
+        elapsed = time.perf_counter() - start
+        self._log_method_stat(method_name, found > 0, elapsed)
+        if found > 0:
+            print(f"  Found {found} images via browser automation")
+        return found
+
+    def _browser_thread(self):
+        """Get the single-worker executor that owns the Playwright browser."""
+        with self._browser_lock:
+            if self._browser_executor is None:
+                self._browser_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='browser')
+            return self._browser_executor
+
+    def _get_browser(self):
+        """
+        Get the long-lived Chromium instance, launching it on first use (or
+        after it crashed). Must be called on the browser thread.
+
+        Returns:
+            playwright Browser
+        """
+        if self._browser is None or not self._browser.is_connected():
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=BROWSER_HEADLESS)
+        return self._browser
+
+    def _close_browser(self):
+        """Shut down the browser and Playwright driver (on the browser thread)."""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        finally:
+            self._browser = None
+            self._playwright = None
+
+    def close(self):
+        """
+        Release resources held across items: the shared browser, if browser
+        automation ever ran. Safe to call more than once.
+        """
+        with self._browser_lock:
+            executor, self._browser_executor = self._browser_executor, None
+        if executor is not None:
+            try:
+                executor.submit(self._close_browser).result()
+            except Exception as e:
+                print(f"  Error closing browser: {e}")
+            executor.shutdown()
+
+    @staticmethod
+    def _wait_for_images(page):
+        """Give a loaded page up to BROWSER_IMAGE_WAIT ms to attach an <img>."""
+        try:
+            page.wait_for_selector('img[src^="http"]', state='attached', timeout=BROWSER_IMAGE_WAIT)
+        except Exception:
+            pass  # Scrape whatever is there
+
+    @staticmethod
+    def _route_browser_request(route):
+        """Abort subresource requests in BROWSER_BLOCKED_RESOURCES."""
+        if route.request.resource_type in BROWSER_BLOCKED_RESOURCES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _browse_for_images(self, queries, image_urls, seen_sigs, search_metadata):
+        """
+        Body of _try_browser_scraping, run on the browser thread. Each call
+        gets a fresh context (cookies, cache) on the shared browser.
+
+        Args:
+            queries: Search query strings
+            image_urls: List to append found image URLs to
+            seen_sigs: Set of already-seen image signatures
+            search_metadata: Metadata dict to update with sources
+        Returns:
+            Number of new images found
+        """
+        found = 0
+        context = self._get_browser().new_context(
+            user_agent=self.user_agents[0],
+            viewport={'width': 1920, 'height': 1080},
+        )
+        try:
+            # Only src/data-* attributes are read, never pixels or styles, so
+            # skip downloading images, media, fonts and CSS altogether
+            context.route('**/*', self._route_browser_request)
+            page = context.new_page()
+            page.set_default_timeout(BROWSER_TIMEOUT)
+
+            for query in queries[:2]:  # Limit to first 2 queries
+                if found >= 5:
+                    break
+
+                # Search Google Images with browser
+                search_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch"
+                # networkidle never settles on Google Images (it keeps
+                # long-polling), so wait for the DOM and a first image instead
+                try:
+                    page.goto(search_url, wait_until='domcontentloaded', timeout=BROWSER_NAV_TIMEOUT)
+                except Exception:
+                    continue
+                self._wait_for_images(page)
+
+                # Scroll down to trigger lazy loading
+                page.evaluate(_BROWSER_SCROLL_JS, [BROWSER_SCROLL_STEPS, BROWSER_SCROLL_PAUSE])
+
+                # Extract image URLs from the rendered page
+                for src, data_src, _, _, width, height in page.evaluate(_BROWSER_IMAGES_JS):
                     if found >= 5:
                         break
+                    img_url = data_src or src
 
-                    # Search Google Images with browser
-                    search_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch"
-                    try:
-                        page.goto(search_url, wait_until='networkidle')
-                    except Exception:
+                    if not img_url or not img_url.startswith('http'):
+                        continue
+                    if 'google' in img_url or 'gstatic' in img_url:
+                        continue
+                    if _SKIPPED_IMAGE_EXT_RE.search(img_url):
+                        continue
+                    # Skip tiny images (likely icons)
+                    if width and height:
                         try:
-                            page.goto(search_url, wait_until='domcontentloaded')
-                        except Exception:
-                            continue
+                            if int(width) < 100 or int(height) < 100:
+                                continue
+                        except ValueError:
+                            pass
 
-                    # Scroll down to trigger lazy loading
-                    for _ in range(3):
-                        page.evaluate('window.scrollBy(0, window.innerHeight)')
-                        page.wait_for_timeout(500)
+                    if self._add_candidate(img_url, ('Browser (Google Images)', search_url),
+                                           image_urls, seen_sigs, search_metadata):
+                        found += 1
 
-                    # Extract image URLs from the rendered page
-                    img_elements = page.query_selector_all('img')
-                    for img in img_elements:
-                        if found >= 5:
-                            break
-                        try:
-                            src = img.get_attribute('src') or ''
-                            data_src = img.get_attribute('data-src') or ''
-                            img_url = data_src or src
+                # Also try visiting product pages found in search results
+                product_urls = [href for href in page.evaluate(_BROWSER_LINKS_JS)
+                                if _RELIABLE_RETAILER_RE.search(href)]
 
-                            if not img_url or not img_url.startswith('http'):
-                                continue
-                            if 'google' in img_url or 'gstatic' in img_url:
-                                continue
-                            if any(ext in img_url.lower() for ext in ['.svg', '.gif', '.ico']):
-                                continue
-                            # Skip tiny images (likely icons)
-                            width = img.get_attribute('width')
-                            height = img.get_attribute('height')
-                            if width and height:
-                                try:
-                                    if int(width) < 100 or int(height) < 100:
-                                        continue
-                                except ValueError:
-                                    pass
+                # Open the product pages side by side. Each goto returns as soon
+                # as its response commits, so the pages then finish loading in
+                # parallel instead of one after another.
+                product_pages = []
+                for product_url in product_urls[:3] if found < 5 else ():
+                    product_page = context.new_page()
+                    try:
+                        product_page.goto(product_url, wait_until='commit', timeout=BROWSER_TIMEOUT)
+                    except Exception:
+                        product_page.close()
+                        continue
+                    product_pages.append((product_url, product_page))
 
-                            sig = self._create_image_signature(img_url)
-                            if sig not in seen_sigs:
-                                image_urls.append(img_url)
-                                seen_sigs.add(sig)
-                                search_metadata['sources'].append(('Browser (Google Images)', search_url))
-                                found += 1
-                        except Exception:
+                for product_url, product_page in product_pages:
+                    try:
+                        if found >= 5:
                             continue
-
-                    # Also try visiting product pages found in search results
-                    links = page.query_selector_all('a[href]')
-                    product_urls = []
-                    for link in links[:20]:
                         try:
-                            href = link.get_attribute('href') or ''
-                            if any(r in href for r in RELIABLE_RETAILERS):
-                                product_urls.append(href)
+                            product_page.wait_for_load_state('domcontentloaded', timeout=BROWSER_NAV_TIMEOUT)
                         except Exception:
                             continue
-
-                    for product_url in product_urls[:3]:
-                        if found >= 5:
-                            break
-                        try:
-                            page.goto(product_url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-                        except Exception:
-                            try:
-                                page.goto(product_url, wait_until='domcontentloaded', timeout=BROWSER_TIMEOUT)
-                            except Exception:
-                                continue
+                        self._wait_for_images(product_page)
 
                         # Scroll to trigger lazy-loaded product images
-                        for _ in range(2):
-                            page.evaluate('window.scrollBy(0, window.innerHeight)')
-                            page.wait_for_timeout(300)
+                        product_page.evaluate(_BROWSER_SCROLL_JS, [BROWSER_SCROLL_STEPS, BROWSER_SCROLL_PAUSE])
 
                         # Extract product images
-                        product_imgs = page.query_selector_all('img')
-                        for img in product_imgs:
+                        for src, data_src, data_zoom, data_highres, _, _ in product_page.evaluate(_BROWSER_IMAGES_JS):
                             if found >= 5:
                                 break
-                            try:
-                                src = img.get_attribute('src') or ''
-                                data_src = (img.get_attribute('data-src')
-                                           or img.get_attribute('data-zoom-image')
-                                           or img.get_attribute('data-highres')
-                                           or '')
-                                img_url = data_src or src
-                                if not img_url or not img_url.startswith('http'):
-                                    continue
-                                if any(ext in img_url.lower() for ext in ['.svg', '.gif', '.ico']):
-                                    continue
-
-                                sig = self._create_image_signature(img_url)
-                                if sig not in seen_sigs:
-                                    image_urls.append(img_url)
-                                    seen_sigs.add(sig)
-                                    search_metadata['sources'].append(('Browser (Retailer)', product_url))
-                                    found += 1
-                            except Exception:
+                            img_url = data_src or data_zoom or data_highres or src
+                            if not img_url or not img_url.startswith('http'):
+                                continue
+                            if _SKIPPED_IMAGE_EXT_RE.search(img_url):
                                 continue
 
-                browser.close()
-
-        except Exception as e:
-            print(f"  Browser automation error: {e}")
+                            if self._add_candidate(img_url, ('Browser (Retailer)', product_url),
+                                                   image_urls, seen_sigs, search_metadata):
+                                found += 1
+                    finally:
+                        product_page.close()
+        finally:
+            context.close()
 
-        elapsed = time.time() - start
-        self._log_method_stat(method_name, found > 0, elapsed)
-        if found > 0:
-            print(f"  Found {found} images via browser automation")
         return found
 
     def _try_scraping_methods(self, queries, max_images, item_data):
@@ -1709,7 +2439,9 @@ class ClothingImageScraper:
         4. Alternative Sources (site-specific Google searches)
         5. Mobile/AMP Endpoints
         6. URL Pattern Manipulation
-        7. Browser Automation (Playwright headless)
+        7. Mobile Google Images (plain HTTP, ijn= paginated)
+        8. Browser Automation (Playwright headless), only if 7 was blocked
+           or found fewer than BROWSER_SKIP_MIN_IMAGES
 
         Args:
             queries: List of search query strings
@@ -1741,18 +2473,15 @@ class ClothingImageScraper:
             print("=" * 50)
 
             # ── METHOD 1: Google Shopping ────────────────────────────────
-            method_start = time.time()
+            method_start = time.perf_counter()
             print("Method 1: Google Shopping (primary source)...")
             shopping_images = self.search_google_shopping(query)
 
+            source = ('Google Shopping', f"https://www.google.com/search?q={quote_plus(query)}&tbm=shop")
             for img_url in shopping_images:
-                sig = self._create_image_signature(img_url)
-                if sig not in seen_image_signatures:
-                    image_urls.append(img_url)
-                    seen_image_signatures.add(sig)
-                    search_metadata['sources'].append(('Google Shopping', f"https://www.google.com/search?q={quote_plus(query)}&tbm=shop"))
+                self._add_candidate(img_url, source, image_urls, seen_image_signatures, search_metadata)
 
-            self._log_method_stat('google_shopping', len(shopping_images) > 0, time.time() - method_start)
+            self._log_method_stat('google_shopping', len(shopping_images) > 0, time.perf_counter() - method_start)
             print(f"  Found {len(shopping_images)} from Google Shopping (total unique: {len(image_urls)})")
 
             if len(image_urls) >= max_images:
@@ -1760,18 +2489,15 @@ class ClothingImageScraper:
                 break
 
             # ── METHOD 2: Google Images ──────────────────────────────────
-            method_start = time.time()
+            method_start = time.perf_counter()
             print("Method 2: Google Images...")
             google_images = self.search_google_images(query)
 
+            source = ('Google Images', f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch")
             for img_url in google_images:
-                sig = self._create_image_signature(img_url)
-                if sig not in seen_image_signatures:
-                    image_urls.append(img_url)
-                    seen_image_signatures.add(sig)
-                    search_metadata['sources'].append(('Google Images', f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch"))
+                self._add_candidate(img_url, source, image_urls, seen_image_signatures, search_metadata)
 
-            self._log_method_stat('google_images', len(google_images) > 0, time.time() - method_start)
+            self._log_method_stat('google_images', len(google_images) > 0, time.perf_counter() - method_start)
             print(f"  Found {len(google_images)} from Google Images (total unique: {len(image_urls)})")
 
             if len(image_urls) >= max_images:
@@ -1779,34 +2505,38 @@ class ClothingImageScraper:
                 break
 
             # ── METHOD 3: Retailer Scraping ──────────────────────────────
-            method_start = time.time()
+            method_start = time.perf_counter()
             print("Method 3: Retail websites...")
             product_pages = self.search_retailers_for_product(query)
             retailer_found = 0
 
             if product_pages:
                 print(f"  Found {len(product_pages)} product pages")
-                for retailer_name, product_url in product_pages[:5]:
-                    if len(image_urls) >= max_images:
-                        break
+
+                def extract(page):
+                    retailer_name, product_url = page
                     print(f"  Extracting from {retailer_name}...")
                     try:
-                        page_images = self.extract_images_from_page(product_url, retailer_name)
-                        for img_url in page_images[:3]:
-                            sig = self._create_image_signature(img_url)
-                            if sig not in seen_image_signatures:
-                                image_urls.append(img_url)
-                                seen_image_signatures.add(sig)
-                                search_metadata['sources'].append((retailer_name, product_url))
-                                retailer_found += 1
-                        time.sleep(0.5)
+                        return self.extract_images_from_page(product_url, retailer_name)
                     except Exception as e:
                         print(f"  Error: {e}")
-                        continue
+                        return []
+
+                # Fetch the product pages in parallel, then merge in priority order
+                pages = product_pages[:5]
+                with ThreadPoolExecutor(max_workers=len(pages)) as pool:
+                    page_results = list(pool.map(extract, pages))
+                for (retailer_name, product_url), page_images in zip(pages, page_results):
+                    if len(image_urls) >= max_images:
+                        break
+                    for img_url in page_images[:3]:
+                        if self._add_candidate(img_url, (retailer_name, product_url),
+                                               image_urls, seen_image_signatures, search_metadata):
+                            retailer_found += 1
             else:
                 print("  No retail product pages found")
 
-            self._log_method_stat('retailer_scraping', retailer_found > 0, time.time() - method_start)
+            self._log_method_stat('retailer_scraping', retailer_found > 0, time.perf_counter() - method_start)
 
             if len(image_urls) >= max_images:
                 print(f"  Found enough images ({len(image_urls)}), stopping search")
@@ -1834,13 +2564,46 @@ class ClothingImageScraper:
             print("Method 7: URL pattern manipulation...")
             self._try_url_pattern_manipulation(image_urls, seen_image_signatures, search_metadata)
 
-        # ── METHOD 8: Browser Automation (Headless) ───────────────────────
-        if len(image_urls) < max_images and PLAYWRIGHT_AVAILABLE:
-            print("Method 8: Browser automation (headless)...")
-            self._try_browser_scraping(queries, image_urls, seen_image_signatures, search_metadata)
+        # ── METHOD 8: Mobile Google Images (plain HTTP) ──────────────────
+        if len(image_urls) < max_images:
+            print("Method 8: Mobile Google Images...")
+            mobile_found, blocked = self._try_mobile_google_images(
+                queries, max_images, image_urls, seen_image_signatures, search_metadata)
+
+            # ── METHOD 9: Browser Automation (Headless) ───────────────────
+            # A plain GET is far cheaper than a browser context, so the
+            # browser only runs when that page was blocked or came up short
+            if (len(image_urls) < max_images and PLAYWRIGHT_AVAILABLE
+                    and (blocked or mobile_found < BROWSER_SKIP_MIN_IMAGES)):
+                print("Method 9: Browser automation (headless)...")
+                self._try_browser_scraping(queries, image_urls, seen_image_signatures, search_metadata)
 
         return image_urls, seen_image_signatures, search_metadata
 
+    @contextmanager
+    def _stream_image(self, url):
+        """
+        Open a streamed GET for an image over HTTP/2 when available,
+        otherwise over the pooled requests session.
+
+        Args:
+            url: Image URL
+
+        Yields:
+            Tuple of (response headers, iterator of body chunks)
+        """
+        if self.image_client is not None:
+            # Same browser headers as the session, including the rotated user agent,
+            # minus the connection-specific ones HTTP/2 forbids
+            headers = _http2_headers(self.session.headers)
+            with self.image_client.stream('GET', url, headers=headers) as response:
+                response.raise_for_status()
+                yield response.headers, response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        else:
+            with self.session.get(url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                yield response.headers, response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
     def download_image(self, url, filepath, item_name=""):
         """
         Download an image from URL to filepath.
@@ -1855,48 +2618,94 @@ class ClothingImageScraper:
             True if high-res, 'low_res' if low-res (moved to low-res folder),
             False if failed/duplicate/thumbnail
         """
-        try:
-            response = self.session.get(url, timeout=15, stream=True)
-            response.raise_for_status()
-
-            # Check if it's actually an image
-            content_type = response.headers.get('Content-Type', '')
-            if 'image' not in content_type:
-                print(f"Warning: URL does not appear to be an image: {content_type}")
-                return False
-
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        # Convert once; the checks below need both forms repeatedly
+        filepath = Path(filepath)
+        filepath_str = str(filepath)
+
+        # A URL already saved for an earlier item would only be rejected by the
+        # hash index after downloading it again, so skip the request entirely
+        original_path = self._downloaded_urls.get(url)
+        if original_path and os.path.exists(original_path):
+            print(f"  Duplicate URL skipped: {filepath.name} already saved as {Path(original_path).name}")
+            self.duplicate_stats['exact'] += 1
+            self.duplicate_stats['details'].append({
+                'new_file': filepath_str,
+                'original_file': original_path,
+                'match_type': 'url',
+            })
+            return False
 
-            # Check for perceptual hash duplicates
-            is_dup, original_path, match_type = self.hash_index.is_duplicate(filepath)
+        try:
+            # Hold the host slot for the whole body stream. Closing the response
+            # returns its connection to the pool even if we bail out early.
+            with self._host_slot(url), self._stream_image(url) as (headers, chunks):
+                # Check if it's actually an image
+                content_type = headers.get('Content-Type', '')
+                if 'image' not in content_type:
+                    print(f"Warning: URL does not appear to be an image: {content_type}")
+                    return False
+                # Tracking pixels and spacers announce themselves in the headers
+                content_length = headers.get('Content-Length')
+                if content_length and content_length.isdigit() and int(content_length) < MIN_IMAGE_BYTES:
+                    print(f"  Skipped tiny image ({content_length} bytes): {filepath.name}")
+                    return False
+
+                # Thumbnails are discarded anyway, so stop as soon as the
+                # header shows one instead of fetching, hashing and indexing
+                # the rest of the body first
+                size = thumb_size = None
+                parser = ImageFile.Parser() if PILLOW_AVAILABLE else None
+                # Keep the body in memory, hashing as it arrives, so duplicates
+                # are rejected before anything is written to disk
+                md5 = hashlib.md5()
+                body = BytesIO()
+                for chunk in chunks:
+                    if parser is not None:
+                        size = self._peek_dimensions(parser, chunk)
+                        if size or body.tell() + len(chunk) >= DOWNLOAD_HEADER_PEEK:
+                            parser = None
+                        if size and (size[0] < MIN_LOW_RES_WIDTH or size[1] < MIN_LOW_RES_HEIGHT):
+                            thumb_size = size
+                            break
+                    md5.update(chunk)
+                    body.write(chunk)
+
+                if thumb_size:
+                    self.quality_stats['checked'] += 1
+                    self.quality_stats['failed'] += 1
+                    print(f"  Thumbnail discarded ({thumb_size[0]}x{thumb_size[1]} < "
+                          f"{MIN_LOW_RES_WIDTH}x{MIN_LOW_RES_HEIGHT}): {filepath.name}")
+                    return False
+
+            # Check for exact and perceptual duplicates, adding the image to the
+            # hash index if it is new (atomic, so concurrent downloads are safe)
+            is_dup, original_path, match_type = self.hash_index.add_or_lookup(
+                filepath, item_name, md5=md5.hexdigest(), data=body)
             if is_dup:
-                print(f"  Duplicate detected ({match_type}): {Path(filepath).name} matches {Path(original_path).name}")
+                print(f"  Duplicate detected ({match_type}): {filepath.name} matches {Path(original_path).name}")
                 self.duplicate_stats[match_type if match_type in ('exact', 'perceptual') else 'exact'] += 1
                 self.duplicate_stats['details'].append({
-                    'new_file': str(filepath),
+                    'new_file': filepath_str,
                     'original_file': original_path,
                     'match_type': match_type,
                 })
-                # Delete the duplicate
-                try:
-                    os.remove(filepath)
-                except OSError:
-                    pass
                 return False
 
-            # Add to hash index
-            self.hash_index.add_image(filepath, item_name)
+            # New image: only now write it out
+            try:
+                filepath.write_bytes(body.getbuffer())
+            except OSError:
+                self.hash_index.remove_image(filepath_str)
+                raise
 
             # Post-download quality check
-            quality_level, width, height = self._check_image_quality(filepath)
+            quality_level, width, height = self._check_image_quality(filepath, size=size)
             if quality_level == 'low_res':
                 # Move to low-res subfolder
-                low_res_filepath = self.low_res_path / Path(filepath).name
+                low_res_filepath = self.low_res_path / filepath.name
                 try:
-                    import shutil
-                    shutil.move(str(filepath), str(low_res_filepath))
+                    shutil.move(filepath_str, str(low_res_filepath))
+                    self._downloaded_urls[url] = str(low_res_filepath)
                     self.low_res_stats['saved'] += 1
                     print(f"  Low-res saved: {low_res_filepath}")
                     return 'low_res'
@@ -1907,11 +2716,12 @@ class ClothingImageScraper:
                 # Delete thumbnail
                 try:
                     os.remove(filepath)
-                    self.hash_index.remove_image(str(filepath))
+                    self.hash_index.remove_image(filepath_str)
                 except OSError:
                     pass
                 return False
 
+            self._downloaded_urls[url] = filepath_str
             print(f"Downloaded: {filepath}")
             return True
 
@@ -1935,8 +2745,26 @@ class ClothingImageScraper:
         Returns:
             Dictionary with downloaded files and metadata
         """
-        downloaded_files = []
-        low_res_files = []
+        plan = self.resolve_urls(brand, barcode, model, color, style,
+                                 max_images=max_images, specific_url=specific_url)
+        return self.download_urls(plan, max_images=max_images)
+
+    def resolve_urls(self, brand=None, barcode=None, model=None,
+                     color=None, style=None, max_images=5, specific_url=None):
+        """
+        Search phase of scrape_and_download: find and verify image URLs
+        without downloading anything, so batch drivers can overlap one
+        item's search with another item's downloads.
+
+        Args:
+            brand, barcode, model, color, style: Search parameters
+            max_images: Maximum number of images wanted, used to size the search
+            specific_url: If provided, scrape this specific product URL instead of searching
+
+        Returns:
+            Plan dict to pass to download_urls, or None if no search
+            parameters were given
+        """
         item_data = {
             'brand': brand,
             'model': model,
@@ -1944,7 +2772,6 @@ class ClothingImageScraper:
             'color': color,
             'barcode': barcode,
         }
-        item_name = ' '.join(v for v in [brand, model, style] if v)
 
         if specific_url:
             # Scrape specific URL
@@ -1952,13 +2779,14 @@ class ClothingImageScraper:
 
             # Determine retailer from URL
             retailer = 'generic'
-            if 'tjmaxx' in specific_url.lower() or 'marshalls' in specific_url.lower():
+            url_lower = specific_url.lower()
+            if 'tjmaxx' in url_lower or 'marshalls' in url_lower:
                 retailer = 'tjx'
-            elif 'nordstrom' in specific_url.lower():
+            elif 'nordstrom' in url_lower:
                 retailer = 'nordstrom'
-            elif 'macys' in specific_url.lower():
+            elif 'macys' in url_lower:
                 retailer = 'macys'
-            elif 'reversible' in specific_url.lower():
+            elif 'reversible' in url_lower:
                 retailer = 'reversible'
 
             image_urls = self.extract_images_from_page(specific_url, retailer)
@@ -1974,7 +2802,7 @@ class ClothingImageScraper:
 
             if not queries:
                 print("No valid search parameters provided!")
-                return {'files': downloaded_files, 'low_res_files': low_res_files, 'metadata': {'search_terms': {}, 'sources': [], 'image_urls': []}}
+                return None
 
             # Use exhaustive scraping methods
             image_urls, seen_sigs, search_metadata = self._try_scraping_methods(queries, max_images, item_data)
@@ -1983,15 +2811,18 @@ class ClothingImageScraper:
         # Pre-download verification: score each URL based on context.
         # Borderline images (within OCR_CONFIDENCE_BOOST of threshold) are
         # kept as candidates for post-download OCR rescue.
+        # Kept per call: batch drivers may run several items on one scraper at once
+        borderline_map = {}
+        item_ctx = self._prepare_item_ctx(item_data)
         if image_urls and any(item_data.values()):
             verified_urls = []
             borderline_urls = []  # Could be rescued by OCR
+            rejected_lines = []
+            # Every candidate is scored against the same first source page
+            source_url = search_metadata['sources'][0][1] if search_metadata['sources'] else ''
             for img_url in image_urls:
                 score, reasons = self._verify_image_relevance(
-                    img_url,
-                    search_metadata['sources'][0][1] if search_metadata['sources'] else '',
-                    item_data
-                )
+                    img_url, source_url, item_data, item_ctx=item_ctx)
                 if score >= CONFIDENCE_THRESHOLD:
                     verified_urls.append(img_url)
                     self.verification_stats['accepted'] += 1
@@ -2005,8 +2836,11 @@ class ClothingImageScraper:
                         'score': score,
                         'reasons': reasons,
                     })
-                    print(f"  Rejected (score={score:.2f}): {img_url[:80]}...")
+                    rejected_lines.append(f"  Rejected (score={score:.2f}): {img_url[:80]}...")
 
+            # One write for the whole list, so concurrent items don't interleave it
+            if rejected_lines:
+                print('\n'.join(rejected_lines))
             if borderline_urls:
                 print(f"  {len(borderline_urls)} borderline image(s) pending OCR verification")
             print(f"Verification: {len(verified_urls)} accepted, "
@@ -2015,7 +2849,45 @@ class ClothingImageScraper:
             image_urls = verified_urls
             # Append borderline URLs at the end for OCR rescue during download
             image_urls.extend(url for url, _, _ in borderline_urls)
-            self._borderline_urls = {url: (score, reasons) for url, score, reasons in borderline_urls}
+            borderline_map = {url: (score, reasons) for url, score, reasons in borderline_urls}
+            self._borderline_urls = borderline_map
+
+        return {
+            'item_data': item_data,
+            'specific_url': specific_url,
+            'image_urls': image_urls,
+            'borderline_map': borderline_map,
+            'item_ctx': item_ctx,
+            'search_metadata': search_metadata,
+        }
+
+    def download_urls(self, plan, max_images=5):
+        """
+        Download phase of scrape_and_download: fetch the URLs found by
+        resolve_urls, apply OCR rescue and low-res handling, and record
+        the item in the download report.
+
+        Args:
+            plan: Dict returned by resolve_urls (None means nothing to do)
+            max_images: Maximum number of images to download
+
+        Returns:
+            Dictionary with downloaded files and metadata
+        """
+        downloaded_files = []
+        low_res_files = []
+        if plan is None:
+            return {'files': downloaded_files, 'low_res_files': low_res_files, 'metadata': {'search_terms': {}, 'sources': [], 'image_urls': []}}
+
+        item_data = plan['item_data']
+        brand, barcode, model, color, style = (
+            item_data[k] for k in ('brand', 'barcode', 'model', 'color', 'style'))
+        specific_url = plan['specific_url']
+        image_urls = plan['image_urls']
+        borderline_map = plan['borderline_map']
+        item_ctx = plan['item_ctx']
+        search_metadata = plan['search_metadata']
+        item_name = ' '.join(v for v in [brand, model, style] if v)
 
         # Download images
         if not image_urls:
@@ -2025,65 +2897,83 @@ class ClothingImageScraper:
         print(f"\nFound {len(image_urls)} verified images")
         print("Downloading images...")
 
-        download_idx = 0
-        for img_url in image_urls:
-            if len(downloaded_files) >= max_images:
-                break
-
-            download_idx += 1
-            filename = self.build_filename(brand, barcode, model, color, style, download_idx)
-            filepath = self.download_path / filename
-
+        def fetch(img_url, filepath):
+            self._pace_host(img_url)  # Be polite to servers
             dl_result = self.download_image(img_url, filepath, item_name=item_name)
+            # OCR in the same worker, so one image's Tesseract run overlaps
+            # the rest of the wave's downloads instead of waiting for them
+            ocr_text = self._extract_ocr_text(str(filepath)) if dl_result is True else None
+            return dl_result, ocr_text
 
-            if dl_result == 'low_res':
-                # Low-res: track but don't count toward max_images, keep searching
-                low_res_files.append(str(self.low_res_path / Path(filepath).name))
-                download_idx -= 1  # Don't increment index for low-res
-                time.sleep(0.5)
-                continue
+        # Download (and OCR) in waves sized to the slots still open, fetching
+        # each wave in parallel, then apply the OCR/low-res bookkeeping in URL order
+        download_idx = 0
+        candidates = iter(image_urls)
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_PARALLEL_DOWNLOADS, max_images))) as pool:
+            while len(downloaded_files) < max_images:
+                wave = list(islice(candidates, max_images - len(downloaded_files)))
+                if not wave:
+                    break
 
-            if dl_result is True:
-                # Post-download OCR verification for borderline images
-                borderline_info = getattr(self, '_borderline_urls', {}).get(img_url)
-                if borderline_info is not None:
-                    pre_score, pre_reasons = borderline_info
-                    ocr_boost, ocr_text, ocr_matches = self._ocr_verify_image(str(filepath), item_data)
-                    final_score = pre_score + ocr_boost
-                    if final_score >= CONFIDENCE_THRESHOLD:
-                        print(f"  OCR rescued (score {pre_score:.2f}+{ocr_boost:.2f}={final_score:.2f}): "
-                              f"matched {ocr_matches}")
-                        self.verification_stats['accepted'] += 1
-                        self.verification_stats.setdefault('ocr_rescued', 0)
-                        self.verification_stats['ocr_rescued'] += 1
-                    else:
-                        # OCR couldn't rescue — remove the file
-                        print(f"  OCR could not rescue (score={final_score:.2f}): {img_url[:80]}...")
-                        self.verification_stats['rejected'] += 1
-                        self.verification_stats['reasons'].append({
-                            'url': img_url,
-                            'score': final_score,
-                            'reasons': pre_reasons + (['ocr_no_match'] if not ocr_matches else []),
-                        })
-                        try:
-                            os.remove(filepath)
-                        except OSError:
-                            pass
-                        # Remove from hash index since we deleted it
-                        self.hash_index.remove_image(str(filepath))
-                        download_idx -= 1
+                filepaths = []
+                for _ in wave:
+                    download_idx += 1
+                    filename = self.build_filename(brand, barcode, model, color, style, download_idx)
+                    filepaths.append(self.download_path / filename)
+                results = list(pool.map(fetch, wave, filepaths))
+
+                # Low-res and OCR-rejected files free their number for reuse
+                download_idx -= len(wave)
+                for slot, (img_url, filepath, (dl_result, ocr_text)) in enumerate(zip(wave, filepaths, results), start=download_idx + 1):
+                    if dl_result == 'low_res':
+                        # Low-res: track but don't count toward max_images, keep searching
+                        low_res_files.append(str(self.low_res_path / filepath.name))
                         continue
-                else:
-                    # Non-borderline: run OCR for logging/stats only
-                    ocr_boost, ocr_text, ocr_matches = self._ocr_verify_image(str(filepath), item_data)
-                    if ocr_matches:
-                        self.verification_stats.setdefault('ocr_confirmed', 0)
-                        self.verification_stats['ocr_confirmed'] += 1
 
-                downloaded_files.append(str(filepath))
-                search_metadata['image_urls'].append(img_url)
+                    if dl_result is True:
+                        filepath_str = str(filepath)
+                        # Post-download OCR verification for borderline images
+                        borderline_info = borderline_map.get(img_url)
+                        if borderline_info is not None:
+                            pre_score, pre_reasons = borderline_info
+                            ocr_boost, ocr_text, ocr_matches = self._ocr_verify_image(
+                                filepath_str, item_data, ocr_text, item_ctx)
+                            final_score = pre_score + ocr_boost
+                            if final_score >= CONFIDENCE_THRESHOLD:
+                                print(f"  OCR rescued (score {pre_score:.2f}+{ocr_boost:.2f}={final_score:.2f}): "
+                                      f"matched {ocr_matches}")
+                                self.verification_stats['accepted'] += 1
+                                self.verification_stats.setdefault('ocr_rescued', 0)
+                                self.verification_stats['ocr_rescued'] += 1
+                            else:
+                                # OCR couldn't rescue — remove the file
+                                print(f"  OCR could not rescue (score={final_score:.2f}): {img_url[:80]}...")
+                                self.verification_stats['rejected'] += 1
+                                self.verification_stats['reasons'].append({
+                                    'url': img_url,
+                                    'score': final_score,
+                                    'reasons': pre_reasons + (['ocr_no_match'] if not ocr_matches else []),
+                                })
+                                try:
+                                    os.remove(filepath)
+                                except OSError:
+                                    pass
+                                # Remove from hash index since we deleted it
+                                self.hash_index.remove_image(filepath_str)
+                                continue
+                        else:
+                            # Non-borderline: run OCR for logging/stats only
+                            ocr_boost, ocr_text, ocr_matches = self._ocr_verify_image(
+                                filepath_str, item_data, ocr_text, item_ctx)
+                            if ocr_matches:
+                                self.verification_stats.setdefault('ocr_confirmed', 0)
+                                self.verification_stats['ocr_confirmed'] += 1
 
-            time.sleep(0.5)  # Be polite to servers
+                        downloaded_files.append(filepath_str)
+                        search_metadata['image_urls'].append(img_url)
+
+                    # Failed downloads keep their number, as before
+                    download_idx = slot
 
         # Track items that only had low-res results
         if not downloaded_files and low_res_files:
@@ -2117,25 +3007,42 @@ class ClothingImageScraper:
 
         self.download_report.append(report_entry)
 
-        return {'files': downloaded_files, 'low_res_files': low_res_files, 'metadata': search_metadata}
+        # The entry is returned too: with items running concurrently,
+        # download_report[-1] may belong to another item
+        return {'files': downloaded_files, 'low_res_files': low_res_files, 'metadata': search_metadata,
+                'report': report_entry}
 
     def _create_image_signature(self, url):
         """
         Create a signature for an image URL to detect duplicates.
         Removes query parameters and focuses on core URL.
         """
-        parsed = urlparse(url)
-        # Use domain + path as signature (ignore query parameters that might differ)
-        signature = f"{parsed.netloc}{parsed.path}"
+        return _image_signature(url)
+
+    def _add_candidate(self, img_url, source, image_urls, seen_signatures, search_metadata):
+        """
+        Record a discovered image URL unless an equivalent one was already found.
 
-        # Also check for common image filename patterns
-        if '/' in signature:
-            filename = signature.split('/')[-1]
-            # Remove size/quality parameters from filename
-            filename = filename.split('?')[0].split('_')[0]
-            signature = f"{parsed.netloc}/{filename}"
+        Keeps image_urls, seen_signatures and search_metadata['sources'] in
+        step, so every discovery method dedups the same way.
 
-        return signature
+        Args:
+            img_url: Candidate image URL
+            source: (source name, source URL) tuple for the search metadata
+            image_urls: List of found image URLs to append to
+            seen_signatures: Set of signatures already found
+            search_metadata: Metadata dict whose 'sources' list is appended to
+
+        Returns:
+            True if the URL was new and recorded
+        """
+        sig = self._create_image_signature(img_url)
+        if sig in seen_signatures:
+            return False
+        seen_signatures.add(sig)
+        image_urls.append(img_url)
+        search_metadata['sources'].append(source)
+        return True
 
     def get_run_summary(self):
         """
@@ -2174,15 +3081,18 @@ def main():
     scraper = ClothingImageScraper(download_path=args.output)
 
     # Scrape and download
-    result = scraper.scrape_and_download(
-        brand=args.brand,
-        barcode=args.barcode,
-        model=args.model,
-        color=args.color,
-        style=args.style,
-        max_images=args.max_images,
-        specific_url=args.url
-    )
+    try:
+        result = scraper.scrape_and_download(
+            brand=args.brand,
+            barcode=args.barcode,
+            model=args.model,
+            color=args.color,
+            style=args.style,
+            max_images=args.max_images,
+            specific_url=args.url
+        )
+    finally:
+        scraper.close()
 
     files = result.get('files', [])
     low_res_files = result.get('low_res_files', [])
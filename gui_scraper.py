@@ -193,15 +193,18 @@ class ScraperGUI:
             scraper = ClothingImageScraper(download_path=str(self.download_path))
             
             # Scrape
-            files = scraper.scrape_and_download(
-                brand=brand,
-                model=model,
-                style=style,
-                color=color,
-                barcode=barcode,
-                specific_url=url,
-                max_images=max_images
-            )
+            try:
+                files = scraper.scrape_and_download(
+                    brand=brand,
+                    model=model,
+                    style=style,
+                    color=color,
+                    barcode=barcode,
+                    specific_url=url,
+                    max_images=max_images
+                )
+            finally:
+                scraper.close()
             
             self.log(f"\nCompleted! Downloaded {len(files)} images:")
             for f in files:
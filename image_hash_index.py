@@ -6,6 +6,7 @@ Uses MD5 for exact matches and pHash/dHash for near-duplicate detection.
 
 import json
 import hashlib
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -18,6 +19,28 @@ except ImportError:
     print("Warning: Pillow and/or imagehash not installed. Perceptual hashing disabled.")
     print("Install with: pip install Pillow imagehash")
 
+# Optional: vectorized Hamming distance over the whole pHash index
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: the index is rewritten after every new image, and orjson
+# serializes it several times faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _popcount64(arr):
+    """Per-element count of set bits in a uint64 array."""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return np.bitwise_count(arr)
+    return np.unpackbits(arr.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
 
 class ImageHashIndex:
     def __init__(self, index_file="image_hashes.json", similarity_threshold=10):
@@ -33,14 +56,24 @@ class ImageHashIndex:
         self.similarity_threshold = similarity_threshold
         self.index = {}  # key: md5 -> entry dict
         self.phash_map = {}  # key: phash_str -> list of md5s
+        # Packed copy of phash_map's keys for Hamming scans, rebuilt lazily
+        self._phash_keys = []
+        self._phash_ints = []
+        self._phash_arr = None
+        self._phash_dirty = True
+        # Re-entrant so callers can hold it across is_duplicate() + add_image()
+        self.lock = threading.RLock()
         self._load()
 
     def _load(self):
         """Load the hash index from disk."""
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if ORJSON_AVAILABLE:
+                    data = orjson.loads(self.index_file.read_bytes())
+                else:
+                    with open(self.index_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                 self.index = data.get('index', {})
                 self.phash_map = data.get('phash_map', {})
                 print(f"  Loaded hash index with {len(self.index)} entries")
@@ -50,25 +83,39 @@ class ImageHashIndex:
 
     def _save(self):
         """Save the hash index to disk."""
-        data = {
-            'index': self.index,
-            'phash_map': self.phash_map,
-        }
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with self.lock:
+            data = {
+                'index': self.index,
+                'phash_map': self.phash_map,
+            }
+            if ORJSON_AVAILABLE:
+                self.index_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                return
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
 
     def _compute_md5(self, filepath):
-        """Compute MD5 hash of a file."""
+        """Compute MD5 hash of a file (a path or a binary file-like object)."""
         md5 = hashlib.md5()
+        if hasattr(filepath, 'read'):
+            filepath.seek(0)
+            for chunk in iter(lambda: filepath.read(8192), b''):
+                md5.update(chunk)
+            return md5.hexdigest()
         with open(filepath, 'rb') as f:
             for chunk in iter(lambda: f.read(8192), b''):
                 md5.update(chunk)
         return md5.hexdigest()
 
-    def _compute_perceptual_hashes(self, filepath):
+    def _compute_perceptual_hashes(self, filepath, data=None):
         """
         Compute perceptual hashes (pHash and dHash) for an image.
 
+        Args:
+            filepath: Path to the image file
+            data: Optional file-like object with the image bytes, read instead
+                  of filepath (e.g. a download not yet written to disk)
+
         Returns:
             Tuple of (phash_str, dhash_str) or (None, None) if unable to compute
         """
@@ -76,7 +123,9 @@ class ImageHashIndex:
             return None, None
 
         try:
-            img = Image.open(filepath)
+            if data is not None:
+                data.seek(0)
+            img = Image.open(data if data is not None else filepath)
             phash = str(imagehash.phash(img))
             dhash = str(imagehash.dhash(img))
             return phash, dhash
@@ -103,30 +152,107 @@ class ImageHashIndex:
 
         # Step 1: Check MD5 (exact duplicate)
         md5 = self._compute_md5(filepath)
-        if md5 in self.index:
-            original = self.index[md5].get('filepath', 'unknown')
-            return True, original, 'exact'
+        with self.lock:
+            if md5 in self.index:
+                original = self.index[md5].get('filepath', 'unknown')
+                return True, original, 'exact'
 
         # Step 2: Check perceptual hash (near duplicate)
         if HASH_LIBS_AVAILABLE:
             phash_str, dhash_str = self._compute_perceptual_hashes(filepath)
             if phash_str:
                 try:
-                    new_phash = imagehash.hex_to_hash(phash_str)
-                    for existing_phash_str, md5_list in self.phash_map.items():
-                        existing_phash = imagehash.hex_to_hash(existing_phash_str)
-                        distance = new_phash - existing_phash
-                        if distance <= self.similarity_threshold:
+                    with self.lock:
+                        match = self._nearest_phash(int(phash_str, 16))
+                        md5_list = self.phash_map.get(match, []) if match else []
+                        if md5_list:
                             # Found a near-match
-                            if md5_list:
-                                original_md5 = md5_list[0]
-                                original = self.index.get(original_md5, {}).get('filepath', 'unknown')
-                                return True, original, 'perceptual'
+                            original_md5 = md5_list[0]
+                            original = self.index.get(original_md5, {}).get('filepath', 'unknown')
+                            return True, original, 'perceptual'
                 except Exception:
                     pass
 
         return False, None, None
 
+    def _rebuild_phash_arrays(self):
+        """Repack phash_map's keys after it changed. Caller holds the lock."""
+        self._phash_keys = list(self.phash_map)
+        self._phash_ints = [int(h, 16) for h in self._phash_keys]
+        self._phash_arr = None
+        # Only 64-bit hashes (the imagehash default) fit a uint64 array
+        if NUMPY_AVAILABLE and self._phash_ints and all(len(h) == 16 for h in self._phash_keys):
+            self._phash_arr = np.array(self._phash_ints, dtype=np.uint64)
+        self._phash_dirty = False
+
+    def _nearest_phash(self, query):
+        """
+        Find the first indexed pHash within the similarity threshold.
+
+        Args:
+            query: pHash as an int
+
+        Returns:
+            The matching phash_str, or None. Caller holds the lock.
+        """
+        if self._phash_dirty:
+            self._rebuild_phash_arrays()
+        if self._phash_arr is not None:
+            distances = _popcount64(self._phash_arr ^ np.uint64(query))
+            hits = np.flatnonzero(distances <= self.similarity_threshold)
+            return self._phash_keys[hits[0]] if hits.size else None
+        for key, value in zip(self._phash_keys, self._phash_ints):
+            if bin(value ^ query).count('1') <= self.similarity_threshold:
+                return key
+        return None
+
+    def add_or_lookup(self, filepath, item_name="", md5=None, data=None):
+        """
+        Check an image against the index and add it if it is new.
+
+        Same result as is_duplicate() followed by add_image(), but the file
+        is hashed once, and perceptual hashes are only computed when the MD5
+        is new. The lookup and insert happen under one lock, so concurrent
+        callers cannot both register the same image.
+
+        Args:
+            filepath: Path to the image file
+            item_name: Human-readable name for the item
+            md5: MD5 hex digest already computed (e.g. while downloading)
+            data: Optional file-like object with the image bytes; lets a
+                  download be checked before it is written to filepath
+
+        Returns:
+            Tuple of (is_dup: bool, original_path: str or None, match_type: str or None)
+        """
+        filepath = Path(filepath)
+        if md5 is None:
+            md5 = self._compute_md5(data if data is not None else filepath)
+
+        # Exact duplicates never need PIL
+        with self.lock:
+            if md5 in self.index:
+                return True, self.index[md5].get('filepath', 'unknown'), 'exact'
+
+        # The expensive part runs outside the lock
+        phash_str, dhash_str = self._compute_perceptual_hashes(filepath, data)
+
+        with self.lock:
+            # Another thread may have added the same bytes meanwhile
+            if md5 in self.index:
+                return True, self.index[md5].get('filepath', 'unknown'), 'exact'
+            if phash_str:
+                try:
+                    match = self._nearest_phash(int(phash_str, 16))
+                except ValueError:
+                    match = None
+                md5_list = self.phash_map.get(match, []) if match else []
+                if md5_list:
+                    original = self.index.get(md5_list[0], {}).get('filepath', 'unknown')
+                    return True, original, 'perceptual'
+            self._insert(filepath, md5, phash_str, dhash_str, item_name)
+        return False, None, None
+
     def add_image(self, filepath, item_name=""):
         """
         Compute hashes and add an image to the index.
@@ -141,7 +267,11 @@ class ImageHashIndex:
         filepath = Path(filepath)
         md5 = self._compute_md5(filepath)
         phash_str, dhash_str = self._compute_perceptual_hashes(filepath)
+        self._insert(filepath, md5, phash_str, dhash_str, item_name)
+        return md5
 
+    def _insert(self, filepath, md5, phash_str, dhash_str, item_name):
+        """Record a hashed image in the index and save it."""
         entry = {
             'filepath': str(filepath),
             'md5': md5,
@@ -151,17 +281,18 @@ class ImageHashIndex:
             'timestamp': datetime.now().isoformat(),
         }
 
-        self.index[md5] = entry
+        with self.lock:
+            self.index[md5] = entry
 
-        # Add to phash map for fast perceptual lookups
-        if phash_str:
-            if phash_str not in self.phash_map:
-                self.phash_map[phash_str] = []
-            if md5 not in self.phash_map[phash_str]:
-                self.phash_map[phash_str].append(md5)
+            # Add to phash map for fast perceptual lookups
+            if phash_str:
+                if phash_str not in self.phash_map:
+                    self.phash_map[phash_str] = []
+                    self._phash_dirty = True
+                if md5 not in self.phash_map[phash_str]:
+                    self.phash_map[phash_str].append(md5)
 
-        self._save()
-        return md5
+            self._save()
 
     def remove_image(self, filepath):
         """
@@ -171,20 +302,22 @@ class ImageHashIndex:
             filepath: Path to the image file to remove
         """
         filepath_str = str(Path(filepath))
-        md5_to_remove = None
-        for md5, entry in self.index.items():
-            if entry.get('filepath') == filepath_str:
-                md5_to_remove = md5
-                break
-
-        if md5_to_remove:
-            phash_str = self.index[md5_to_remove].get('phash')
-            del self.index[md5_to_remove]
-            if phash_str and phash_str in self.phash_map:
-                self.phash_map[phash_str] = [m for m in self.phash_map[phash_str] if m != md5_to_remove]
-                if not self.phash_map[phash_str]:
-                    del self.phash_map[phash_str]
-            self._save()
+        with self.lock:
+            md5_to_remove = None
+            for md5, entry in self.index.items():
+                if entry.get('filepath') == filepath_str:
+                    md5_to_remove = md5
+                    break
+
+            if md5_to_remove:
+                phash_str = self.index[md5_to_remove].get('phash')
+                del self.index[md5_to_remove]
+                if phash_str and phash_str in self.phash_map:
+                    self.phash_map[phash_str] = [m for m in self.phash_map[phash_str] if m != md5_to_remove]
+                    if not self.phash_map[phash_str]:
+                        del self.phash_map[phash_str]
+                        self._phash_dirty = True
+                self._save()
 
     def get_duplicate_report(self):
         """
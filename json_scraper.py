@@ -190,12 +190,16 @@ class JSONBatchScraper:
         self.stats['start_time'] = datetime.now()
         
         # Process each item
-        for idx, item in enumerate(items, start=1):
-            self.process_item(item, idx)
-            
-            if idx < len(items):
-                self.log(f"Waiting {self.delay_between_items} seconds before next item...", 'INFO')
-                time.sleep(self.delay_between_items)
+        try:
+            for idx, item in enumerate(items, start=1):
+                self.process_item(item, idx)
+                
+                if idx < len(items):
+                    self.log(f"Waiting {self.delay_between_items} seconds before next item...", 'INFO')
+                    time.sleep(self.delay_between_items)
+        finally:
+            # The browser is shared by all items; shut it down once at the end
+            self.scraper.close()
         
         # Finalize stats
         self.stats['end_time'] = datetime.now()
@@ -7,6 +7,8 @@ Central configuration file for all tunable parameters
 CONFIDENCE_THRESHOLD = 0.3  # Minimum verification confidence score (0.0 to 1.0)
 OCR_ENABLED = True          # Enable OCR text extraction for image verification
 OCR_CONFIDENCE_BOOST = 0.15 # Score boost when OCR text matches identifiers
+OCR_MAX_EDGE = 1500         # Downscale images so the longest edge is at most this before OCR
+OCR_TESSERACT_CONFIG = '--oem 1 --psm 11'  # LSTM engine, sparse text (labels, logos)
 
 # Perceptual Hashing / Duplicate Prevention
 HASH_SIMILARITY_THRESHOLD = 10  # Hamming distance threshold for perceptual hash comparison
@@ -22,9 +24,32 @@ LOW_RES_SUBFOLDER = "low-res"  # Subfolder for low-res images
 # Timeouts
 METHOD_TIMEOUT = 15  # Per-method timeout in seconds
 
+# HTTP Connection Pooling
+HTTP_POOL_CONNECTIONS = 16  # Number of per-host connection pools to cache
+HTTP_POOL_MAXSIZE = 32      # Max keep-alive connections kept per host
+PER_HOST_CONCURRENCY = 4    # Max simultaneous requests to any single host
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per chunk when streaming images to disk
+DOWNLOAD_HEADER_PEEK = 256 * 1024  # Max leading bytes parsed for dimensions before skipping the early thumbnail check
+MIN_IMAGE_BYTES = 1024      # Downloads declaring a smaller Content-Length are skipped unread (pixels, spacers)
+MAX_PARALLEL_DOWNLOADS = 8  # Max images fetched at once for a single item
+DOWNLOAD_HOST_DELAY = 0.5   # Seconds between starting image downloads from the same host
+HTTP2_IMAGES = True         # Multiplex image downloads over HTTP/2 when httpx[http2] is installed
+RETAILER_SEARCH_WORKERS = 8 # Retailer sites searched at once (each is a different host)
+HTTP_RETRIES = 2            # Connection-level retries on errors, 429 and 5xx
+HTTP_RETRY_BACKOFF = 0.5    # Exponential backoff factor (seconds) between those retries
+PAGE_CACHE_SIZE = 256       # Product pages whose high-res image URLs are kept for reuse
+
 # Browser Automation
 BROWSER_HEADLESS = True     # Run browser in headless mode (no visible window)
 BROWSER_TIMEOUT = 30000     # Playwright page timeout in milliseconds
+BROWSER_NAV_TIMEOUT = 8000  # Milliseconds to wait for a page's DOM to load
+BROWSER_IMAGE_WAIT = 3000   # Milliseconds to then wait for a first absolute-URL <img>
+BROWSER_SCROLL_STEPS = 6    # Max viewport scrolls per page to trigger lazy-loaded images
+BROWSER_SCROLL_PAUSE = 200  # Milliseconds after each scroll; scrolling stops once no new <img> appears
+BROWSER_SKIP_MIN_IMAGES = 3 # Skip the browser when the plain-HTTP mobile Google Images page yields this many
+MOBILE_GOOGLE_PAGES = 2     # Result pages (ijn=0, 1, ...) fetched per query by that plain-HTTP lookup
+MOBILE_USER_AGENT = 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1'
+BROWSER_BLOCKED_RESOURCES = ('image', 'media', 'font', 'stylesheet')  # Subresources never fetched (only markup is read)
 
 # Known reliable retailers for verification scoring
 RELIABLE_RETAILERS = [